@@ -6,9 +6,9 @@ from pathlib import Path
 from typing import Optional
 
 from . import __version__
-from .config import load_rules, validate_config
-from .scanner import Scanner
-from .reporters.reporter import get_reporter
+
+# Scanner, reporter and config modules pull in gitpython, colorama and
+# PyYAML, so each command imports what it needs to keep startup fast.
 
 
 @click.group()
@@ -52,6 +52,12 @@ def main():
     default=True,
     help='Exit with code 1 if secrets found (useful for CI/CD)'
 )
+@click.option(
+    '--jobs', '-j',
+    type=click.IntRange(min=0),
+    default=1,
+    help='Worker processes for directory and history scans (0 = one per available CPU)'
+)
 def scan(
     targets: tuple,
     rules: Optional[str],
@@ -59,7 +65,8 @@ def scan(
     max_commits: Optional[int],
     format: str,
     verbose: bool,
-    exit_code: bool
+    exit_code: bool,
+    jobs: int
 ):
     """
     Scan files, directories, or Git repositories for secrets.
@@ -80,46 +87,52 @@ def scan(
       
       # Output as JSON
       secret-scanner scan --format json .
+      
+      # Scan a large tree on every CPU
+      secret-scanner scan --jobs 0 .
     """
     try:
+        from .config import load_rules, validate_config
+        from .scanner import Scanner, available_cpus
+        from .reporters.reporter import get_reporter
+        
         # Load configuration
         config = load_rules(rules)
         
         # Validate config and show warnings
         warnings = validate_config(config)
         if warnings and verbose:
-            click.echo(click.style("⚠  Configuration warnings:", fg='yellow'))
+            click.echo(click.style("⚠  Configuration warnings:", fg='yellow'), err=True)
             for warning in warnings:
-                click.echo(click.style(f"   • {warning}", fg='yellow'))
-            click.echo()
+                click.echo(click.style(f"   • {warning}", fg='yellow'), err=True)
+            click.echo(err=True)
         
         # Create scanner
-        scanner = Scanner(config)
+        scanner = Scanner(config, jobs=jobs or available_cpus())
         
-        # Scan all targets
-        all_findings = []
-        for target in targets:
-            target_path = Path(target)
-            
-            if verbose:
-                mode = "Git history" if git_history else "files"
-                click.echo(f"Scanning {mode} in: {target_path}")
-            
-            try:
-                findings = scanner.scan(
-                    target_path,
-                    git_history=git_history,
-                    max_commits=max_commits
-                )
-                all_findings.extend(findings)
-            except Exception as e:
-                click.echo(click.style(f"Error scanning {target}: {e}", fg='red'), err=True)
+        def iter_findings():
+            """Yield findings from every target, reporting per-target errors."""
+            for target in targets:
+                target_path = Path(target)
+                
                 if verbose:
-                    import traceback
-                    traceback.print_exc()
-                continue
+                    mode = "Git history" if git_history else "files"
+                    click.echo(f"Scanning {mode} in: {target_path}", err=True)
+                
+                try:
+                    yield from scanner.iter_scan(
+                        target_path,
+                        git_history=git_history,
+                        max_commits=max_commits
+                    )
+                except Exception as e:
+                    click.echo(click.style(f"Error scanning {target}: {e}", fg='red'), err=True)
+                    if verbose:
+                        import traceback
+                        traceback.print_exc()
+                    continue
         
-        # Report results
+        # Report results as they are produced
         reporter_kwargs = {}
         if format == 'console':
             reporter_kwargs['verbose'] = verbose
@@ -127,10 +140,10 @@ def scan(
             reporter_kwargs['pretty'] = True
         
         reporter = get_reporter(format, **reporter_kwargs)
-        reporter.report(all_findings)
+        total_findings = reporter.stream(iter_findings())
         
         # Exit with appropriate code
-        if exit_code and all_findings:
+        if exit_code and total_findings:
             sys.exit(1)
         
     except Exception as e:
@@ -160,6 +173,8 @@ def validate(rules: Optional[str]):
       secret-scanner validate --rules my_rules.yaml
     """
     try:
+        from .config import load_rules, validate_config
+        
         config = load_rules(rules)
         
         click.echo(click.style("✓ Configuration loaded successfully", fg='green'))
@@ -200,6 +215,8 @@ def list_rules(rules: Optional[str]):
       secret-scanner list-rules --rules my_rules.yaml
     """
     try:
+        from .config import load_rules
+        
         config = load_rules(rules)
         
         click.echo(f"\nAvailable Rules ({len(config.rules)}):\n")
@@ -274,7 +291,9 @@ def scan_github(repo_url: str, token: str, git_history: bool, max_commits: int,
     Select scope: 'public_repo' for read-only access to public repositories
     """
     try:
+        from .config import load_rules
         from .github_scanner import GitHubScanner
+        from .reporters.reporter import get_reporter
         
         # Load config
         config = load_rules()
@@ -283,10 +302,10 @@ def scan_github(repo_url: str, token: str, git_history: bool, max_commits: int,
         gh_scanner = GitHubScanner(config, token)
         
         if verbose:
-            click.echo(f"Scanning GitHub repository: {repo_url}")
+            click.echo(f"Scanning GitHub repository: {repo_url}", err=True)
             if token:
                 rate_limit = gh_scanner.get_rate_limit()
-                click.echo(f"API Rate Limit: {rate_limit['core']['remaining']}/{rate_limit['core']['limit']}")
+                click.echo(f"API Rate Limit: {rate_limit['core']['remaining']}/{rate_limit['core']['limit']}", err=True)
         
         # Scan repository
         result = gh_scanner.scan_repository(
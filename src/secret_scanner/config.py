@@ -1,8 +1,25 @@
 """Configuration loader for secret scanner rules."""
 
+import re
+from collections import Counter
+from importlib import resources
 import yaml
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Pattern
+
+from .prefilter import RulePrefilter, build_prefilter
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Flags every rule regex is compiled with
+REGEX_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Bundled rules used when no rules file is given, relative to this package
+DEFAULT_RULES = "data/default_rules.yaml"
 
 
 class Config:
@@ -12,6 +29,51 @@ class Config:
         self.rules = rules
         self.exclusions = exclusions
     
+    @property
+    def rules(self) -> List[Dict[str, Any]]:
+        return self._rules
+    
+    @rules.setter
+    def rules(self, rules: List[Dict[str, Any]]):
+        # Replacing the rules invalidates the compiled patterns
+        self._rules = rules
+        self._patterns = None
+        self._prefilter = None
+    
+    def compile(self, prefilter: bool = False) -> None:
+        """
+        Compile the rule patterns now rather than on first use.
+        
+        Args:
+            prefilter: Also build the Hyperscan prefilter
+        
+        Raises:
+            ValueError: If a rule has an invalid regex
+        """
+        if self._patterns is None:
+            self._patterns = compile_rules(self.rules)
+        if prefilter and self._prefilter is None:
+            self._prefilter = build_prefilter(self._patterns)
+    
+    @property
+    def patterns(self) -> List[Tuple[Dict[str, Any], Pattern]]:
+        """Rules paired with their compiled regex, compiled once on first use."""
+        self.compile()
+        return self._patterns
+    
+    @property
+    def prefilter(self) -> Optional[RulePrefilter]:
+        """Hyperscan prefilter over the patterns, or None without hyperscan."""
+        self.compile(prefilter=True)
+        return self._prefilter
+    
+    def __getstate__(self):
+        # Ship rules only; the receiving process compiles on first use
+        state = self.__dict__.copy()
+        state['_patterns'] = None
+        state['_prefilter'] = None
+        return state
+    
     def __repr__(self):
         return f"Config(rules={len(self.rules)}, exclusions={len(self.exclusions)})"
 
@@ -29,18 +91,20 @@ def load_rules(rules_path: Optional[str] = None) -> Config:
     Raises:
         FileNotFoundError: If rules file doesn't exist
         yaml.YAMLError: If YAML is malformed
+        ValueError: If a rule is missing fields or has an invalid regex
     """
     if rules_path is None:
-        # Use default rules from config directory
-        rules_path = Path(__file__).parent.parent.parent / "config" / "default_rules.yaml"
+        # Default rules ship inside the package, so this works from a wheel too
+        text = resources.files(__package__).joinpath(DEFAULT_RULES).read_text(encoding='utf-8')
     else:
         rules_path = Path(rules_path)
+        
+        if not rules_path.exists():
+            raise FileNotFoundError(f"Rules file not found: {rules_path}")
+        
+        text = rules_path.read_text(encoding='utf-8')
     
-    if not rules_path.exists():
-        raise FileNotFoundError(f"Rules file not found: {rules_path}")
-    
-    with open(rules_path, 'r', encoding='utf-8') as f:
-        data = yaml.safe_load(f)
+    data = yaml.load(text, Loader=SafeLoader)
     
     rules = data.get('rules', [])
     exclusions = data.get('exclusions', [])
@@ -54,7 +118,36 @@ def load_rules(rules_path: Optional[str] = None) -> Config:
         if 'description' not in rule:
             rule['description'] = rule['id']  # Default to ID if no description
     
-    return Config(rules=rules, exclusions=exclusions)
+    config = Config(rules=rules, exclusions=exclusions)
+    
+    # Compile up front so a bad pattern fails at load time, not mid-scan
+    config.compile()
+    
+    return config
+
+
+def compile_rules(rules: List[Dict[str, Any]]) -> List[Tuple[Dict[str, Any], Pattern]]:
+    """
+    Compile the regex of every rule.
+    
+    Args:
+        rules: List of rule dictionaries
+        
+    Returns:
+        List of (rule, compiled pattern) tuples in rule order
+        
+    Raises:
+        ValueError: If a rule's regex is invalid
+    """
+    compiled = []
+    for rule in rules:
+        try:
+            pattern = re.compile(rule['regex'], REGEX_FLAGS)
+        except re.error as e:
+            raise ValueError(f"Invalid regex in rule '{rule['id']}': {e}")
+        compiled.append((rule, pattern))
+    
+    return compiled
 
 
 def get_default_config() -> Config:
@@ -83,8 +176,8 @@ def validate_config(config: Config) -> List[str]:
         warnings.append("No rules defined in configuration")
     
     # Check for duplicate rule IDs
-    rule_ids = [r['id'] for r in config.rules]
-    duplicates = set([x for x in rule_ids if rule_ids.count(x) > 1])
+    rule_id_counts = Counter(r['id'] for r in config.rules)
+    duplicates = [rule_id for rule_id, count in rule_id_counts.items() if count > 1]
     if duplicates:
         warnings.append(f"Duplicate rule IDs found: {', '.join(duplicates)}")
     
@@ -1,13 +1,57 @@
 """Entropy detection module for identifying high-entropy strings."""
 
 import math
+import string
 from collections import Counter
+from functools import lru_cache
+from typing import List
 
+# Precomputed c * log2(c) for symbol counts up to _XLOGX_LIMIT. Candidate strings
+# are short, so this turns the per-symbol log2 call into a tuple lookup.
+_XLOGX_LIMIT = 4096
+_XLOGX = tuple(c * math.log2(c) if c else 0.0 for c in range(_XLOGX_LIMIT + 1))
 
+# Character classes deleted with bytes.translate(None, ...) to test membership in C;
+# base64 uses A-Za-z0-9+/= characters
+_HEX_BYTES = string.hexdigits.encode('ascii')
+_BASE64_BYTES = (string.ascii_letters + string.digits + "+/=").encode('ascii')
+_HEX_CHARS = frozenset(string.hexdigits)
+_BASE64_CHARS = frozenset(_BASE64_BYTES.decode('ascii'))
+
+# ASCII strings at least this long are histogrammed with numpy when it is
+# installed; below it numpy's per-call overhead costs more than Counter
+NUMPY_MIN_LENGTH = 256
+
+
+@lru_cache(maxsize=None)
+def _numpy():
+    """Import numpy on first use (it is slow to import), or None if missing."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def _entropy_from_counts(counts, length: int) -> float:
+    """Shannon entropy of a string given its symbol counts and length."""
+    if length <= _XLOGX_LIMIT:
+        total = sum(map(_XLOGX.__getitem__, counts))
+    else:
+        total = sum(c * math.log2(c) for c in counts)
+    
+    # -sum(p * log2(p)) with p = c / n rearranges to log2(n) - sum(c * log2(c)) / n
+    return max(0.0, math.log2(length) - total / length)
+
+
+@lru_cache(maxsize=4096)
 def shannon_entropy(data: str) -> float:
     """
     Calculate Shannon entropy in bits per character.
     
+    Results are memoized: the same secret literal tends to match in many
+    files and commits, and is only scored once.
+    
     Args:
         data: The string to analyze
         
@@ -23,15 +67,66 @@ def shannon_entropy(data: str) -> float:
     if not data:
         return 0.0
     
-    entropy = 0.0
     length = len(data)
-    freq = Counter(data)
+    if length >= NUMPY_MIN_LENGTH and data.isascii():
+        np = _numpy()
+        if np is not None:
+            # ASCII bytes are the characters, so a 256-bin bincount is the
+            # same histogram Counter would build
+            counts = np.bincount(np.frombuffer(data.encode('ascii'), dtype=np.uint8))
+            counts = counts[counts > 0]
+            total = float((counts * np.log2(counts)).sum())
+            return max(0.0, math.log2(length) - total / length)
+    
+    # Counter counts in C; a Python loop over a 256-entry list is 1.1-2.7x slower
+    return _entropy_from_counts(Counter(data).values(), length)
+
+
+def rolling_entropy(data: str, window: int) -> List[float]:
+    """
+    Calculate the Shannon entropy of every `window`-length substring.
+    
+    Symbol counts and the running sum of c * log2(c) are updated as the
+    window slides, so a sweep costs O(len(data)) instead of re-counting
+    each window.
     
-    for count in freq.values():
-        p_x = count / length
-        entropy += -p_x * math.log2(p_x)
+    Args:
+        data: The string to analyze
+        window: Window length in characters
+        
+    Returns:
+        List of len(data) - window + 1 entropy values, the i-th being the
+        entropy of data[i:i + window] (empty if data is shorter than window)
+        
+    Example:
+        >>> rolling_entropy("aabb", 2)
+        [0.0, 1.0, 0.0]
+    """
+    if window < 1:
+        raise ValueError(f"window must be positive, got {window}")
+    
+    if len(data) < window:
+        return []
     
-    return entropy
+    xlogx = [c * math.log2(c) if c else 0.0 for c in range(window + 1)]
+    log_window = math.log2(window)
+    counts = Counter(data[:window])
+    total = sum(xlogx[c] for c in counts.values())
+    entropies = [max(0.0, log_window - total / window)]
+    
+    for outgoing, incoming in zip(data, data[window:]):
+        if outgoing != incoming:
+            count = counts[outgoing]
+            total += xlogx[count - 1] - xlogx[count]
+            counts[outgoing] = count - 1
+            
+            count = counts[incoming]
+            total += xlogx[count + 1] - xlogx[count]
+            counts[incoming] = count + 1
+        
+        entropies.append(max(0.0, log_window - total / window))
+    
+    return entropies
 
 
 def is_base64(text: str) -> bool:
@@ -44,21 +139,18 @@ def is_base64(text: str) -> bool:
     Returns:
         True if string appears to be base64 encoded
     """
-    if len(text) < 16:
+    # Base64 strings are typically divisible by 4 (with padding); checked
+    # first since it needs no pass over the text
+    if len(text) < 16 or len(text) % 4 != 0:
         return False
     
-    # Base64 uses A-Za-z0-9+/= characters
-    base64_chars = set("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/=")
-    char_set = set(text)
+    # Non-ASCII characters are dropped by the encode and count as invalid;
+    # whatever survives deleting the base64 alphabet is invalid too
+    data = text.encode('ascii', 'ignore')
+    invalid_chars = len(text) - len(data) + len(data.translate(None, _BASE64_BYTES))
     
     # Check if at least 95% of characters are valid base64
-    valid_chars = sum(1 for c in text if c in base64_chars)
-    ratio = valid_chars / len(text)
-    
-    # Base64 strings are typically divisible by 4 (with padding)
-    length_check = len(text) % 4 == 0
-    
-    return ratio >= 0.95 and length_check
+    return (len(text) - invalid_chars) / len(text) >= 0.95
 
 
 def is_hex(text: str) -> bool:
@@ -71,14 +163,11 @@ def is_hex(text: str) -> bool:
     Returns:
         True if string is valid hex
     """
-    if len(text) < 16:
+    if len(text) < 16 or not text.isascii():
         return False
     
-    try:
-        int(text, 16)
-        return True
-    except ValueError:
-        return False
+    # Deleting every hex digit leaves nothing behind iff the string is pure hex
+    return not text.encode('ascii').translate(None, _HEX_BYTES)
 
 
 def calculate_entropy_score(text: str, min_length: int = 20) -> tuple[float, dict]:
@@ -95,14 +184,19 @@ def calculate_entropy_score(text: str, min_length: int = 20) -> tuple[float, dic
     if len(text) < min_length:
         return 0.0, {"too_short": True}
     
-    ent = shannon_entropy(text)
+    # One histogram pass feeds every metric below
+    length = len(text)
+    counts = Counter(text)
+    chars = counts.keys()
+    ent = _entropy_from_counts(counts.values(), length)
+    base64_chars = sum(counts[c] for c in chars & _BASE64_CHARS)
     
     metadata = {
         "entropy": round(ent, 2),
-        "length": len(text),
-        "is_base64": is_base64(text),
-        "is_hex": is_hex(text),
-        "unique_chars": len(set(text))
+        "length": length,
+        "is_base64": length >= 16 and base64_chars / length >= 0.95 and length % 4 == 0,
+        "is_hex": length >= 16 and chars <= _HEX_CHARS,
+        "unique_chars": len(counts)
     }
     
     return ent, metadata
@@ -1,33 +1,81 @@
 """GitHub repository scanner for detecting secrets in public repositories."""
 
+import base64
+import os
+import re
+import tarfile
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Iterable, List, Optional, Dict, Tuple
 import git
-from github import Github, Repository, GithubException
+from github import Auth, Github, Repository, GithubException
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 
-from .scanner import Scanner, Finding
+from .scanner import Scanner, Finding, scan_stream
 from .config import Config
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Pause for the rate-limit reset once fewer core requests than this remain
+RATE_LIMIT_FLOOR = 10
+
+# Seconds a get_rate_limit() result is reused before asking the API again
+RATE_LIMIT_TTL = 15
+
+# owner/repo, or an HTTPS or SSH GitHub URL with optional trailing path.
+# Owners cannot contain dots, and a trailing path needs the github.com host,
+# so other hosts such as gitlab.com/owner/repo are rejected
+REPO_URL_PATTERN = re.compile(
+    r'^(?:(?:https?://)?(?:www\.)?github\.com/|git@github\.com:|(?=[^/]+/[^/]+/?$))'
+    r'([\w-]+)/([\w.-]+?)(?:\.git)?(?:/.*)?$'
+)
+
 
 class GitHubScanner:
     """Scanner for GitHub public repositories."""
     
-    def __init__(self, config: Config, github_token: str):
+    def __init__(self, config: Config, github_token: str, max_workers: int = 4):
         """
         Initialize GitHub scanner with authenticated access.
         
         Args:
             config: Scanner configuration
             github_token: GitHub personal access token (PAT)
+            max_workers: Repositories cloned and scanned concurrently
         """
         self.config = config
         self.scanner = Scanner(config)
         self.github_token = github_token
-        self.github = Github(github_token)
+        self.max_workers = max_workers
+        self._rate_limit_cache: Optional[Tuple[float, Dict]] = None
+        # One client for the scanner's lifetime: full pages cut pagination
+        # round trips, and the connection pool covers every worker thread
+        self.github = Github(
+            auth=Auth.Token(github_token),
+            per_page=100,
+            pool_size=max(max_workers, 10)
+        )
+        
+        # Raw HTTP (archive downloads) shares one keep-alive session, backing
+        # off on 429/5xx and honouring Retry-After like PyGithub does
+        self.session = requests.Session()
+        self.session.headers.update({
+            'Authorization': f'Bearer {github_token}',
+            'Accept': 'application/vnd.github+json'
+        })
+        retry = Retry(
+            total=5,
+            backoff_factor=1,
+            status_forcelist=[429, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+        self.session.mount('https://', HTTPAdapter(max_retries=retry, pool_maxsize=max(max_workers, 10)))
         
         # Verify authentication
         try:
@@ -60,39 +108,149 @@ class GitHubScanner:
         try:
             # Get repository info
             repo = self.github.get_repo(repo_name)
+        except GithubException as e:
+            raise ValueError(f"GitHub API error: {e.data.get('message', str(e))}")
+        except Exception as e:
+            raise ValueError(f"Error scanning repository: {str(e)}")
+        
+        return self._scan_repo(repo, scan_history, max_commits)
+    
+    def _scan_repo(
+        self,
+        repo: Repository.Repository,
+        scan_history: bool,
+        max_commits: Optional[int]
+    ) -> Dict:
+        """
+        Scan a repository whose metadata has already been fetched.
+        
+        Repository listings carry every field used here, so repositories
+        taken from a listing are scanned without another API round trip.
+        """
+        try:
+            if scan_history:
+                findings = self._scan_clone(repo, max_commits)
+            else:
+                findings = self._scan_tarball(repo)
             
-            # Clone repository to temp directory
-            with tempfile.TemporaryDirectory() as temp_dir:
-                temp_path = Path(temp_dir)
-                
-                print(f"Cloning repository: {repo.full_name}...")
-                git.Repo.clone_from(repo.clone_url, temp_path, depth=max_commits if scan_history else 1)
-                
-                # Scan the repository
-                print(f"Scanning repository...")
-                findings = self.scanner.scan(
-                    temp_path,
-                    git_history=scan_history,
-                    max_commits=max_commits
-                )
-                
-                return {
-                    "repo_name": repo.full_name,
-                    "repo_url": repo.html_url,
-                    "stars": repo.stargazers_count,
-                    "language": repo.language,
-                    "is_fork": repo.fork,
-                    "findings": findings,
-                    "total_findings": len(findings)
-                }
+            return {
+                "repo_name": repo.full_name,
+                "repo_url": repo.html_url,
+                "stars": repo.stargazers_count,
+                "language": repo.language,
+                "is_fork": repo.fork,
+                "findings": findings,
+                "total_findings": len(findings)
+            }
         
         except GithubException as e:
             raise ValueError(f"GitHub API error: {e.data.get('message', str(e))}")
         except git.exc.GitCommandError as e:
             raise ValueError(f"Git clone error: {str(e)}")
+        except requests.RequestException as e:
+            raise ValueError(f"Download error: {str(e)}")
         except Exception as e:
             raise ValueError(f"Error scanning repository: {str(e)}")
     
+    def _scan_clone(self, repo: Repository.Repository, max_commits: Optional[int]) -> List[Finding]:
+        """Clone a repository without a working tree and scan its history."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            
+            print(f"Cloning repository: {repo.full_name}...")
+            # History scans read commit objects only, so skip the checkout
+            git.Repo.clone_from(
+                repo.clone_url,
+                temp_path,
+                depth=max_commits,
+                single_branch=True,
+                no_tags=True,
+                no_checkout=True
+            )
+            
+            print(f"Scanning repository...")
+            return self.scanner.scan(temp_path, git_history=True, max_commits=max_commits)
+    
+    def _scan_checkout(self, repo: Repository.Repository) -> List[Finding]:
+        """Shallow-clone the default branch with a working tree and scan its files."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            
+            print(f"Cloning repository: {repo.full_name}...")
+            git.Repo.clone_from(
+                repo.clone_url,
+                temp_path,
+                depth=1,
+                single_branch=True,
+                no_tags=True
+            )
+            
+            print(f"Scanning repository...")
+            findings = self.scanner.scan(temp_path)
+        
+        # Report paths relative to the repository root, as archive scans do
+        for finding in findings:
+            finding.file_path = os.path.relpath(finding.file_path, temp_path)
+        return findings
+    
+    def _archive_is_faithful(self, repo: Repository.Repository) -> bool:
+        """
+        Whether the default branch's archive contains exactly its files.
+        
+        The Archive API applies .gitattributes export-ignore and export-subst,
+        so a committed file can be left out of the tarball or rewritten in
+        it. Any .gitattributes using either (or a tree too large to list)
+        means the archive cannot be trusted.
+        """
+        tree = repo.get_git_tree(repo.default_branch, recursive=True)
+        if tree.raw_data.get('truncated'):
+            return False
+        
+        for entry in tree.tree:
+            if entry.path == '.gitattributes' or entry.path.endswith('/.gitattributes'):
+                attributes = base64.b64decode(repo.get_git_blob(entry.sha).content)
+                if b'export-ignore' in attributes or b'export-subst' in attributes:
+                    return False
+        
+        return True
+    
+    def _scan_tarball(self, repo: Repository.Repository) -> List[Finding]:
+        """
+        Scan the default branch by streaming its tarball from the Archive API.
+        
+        Members are scanned straight from the gzip stream, so nothing is
+        written to disk and no git metadata is transferred. Repositories
+        whose archive may differ from the branch, or whose archive cannot
+        be downloaded, are cloned instead.
+        """
+        try:
+            if not self._archive_is_faithful(repo):
+                return self._scan_checkout(repo)
+        except GithubException as e:
+            # An empty repository has no tree to list and nothing to scan
+            if e.status == 409:
+                return []
+            raise
+        
+        url = f"{GITHUB_API_URL}/repos/{repo.full_name}/tarball/{repo.default_branch}"
+        findings = []
+        
+        print(f"Downloading and scanning repository: {repo.full_name}...")
+        with self.session.get(url, stream=True, timeout=60) as response:
+            if not response.ok:
+                return self._scan_checkout(repo)
+            
+            with tarfile.open(fileobj=response.raw, mode='r|gz') as archive:
+                for member in archive:
+                    if not member.isfile():
+                        continue
+                    
+                    # Drop the "owner-repo-sha/" directory GitHub prefixes every path with
+                    file_path = member.name.split('/', 1)[-1]
+                    findings.extend(scan_stream(file_path, archive.extractfile(member), self.config))
+        
+        return findings
+    
     def scan_user_repositories(
         self,
         username: str,
@@ -114,35 +272,7 @@ class GitHubScanner:
             user = self.github.get_user(username)
             repos = user.get_repos(sort='updated', direction='desc')
             
-            results = []
-            scanned = 0
-            
-            for repo in repos:
-                if scanned >= max_repos:
-                    break
-                
-                # Skip private repos and forks (optional)
-                if repo.private:
-                    continue
-                
-                try:
-                    print(f"\nScanning {repo.full_name}...")
-                    result = self.scan_repository(
-                        repo.full_name,
-                        scan_history=scan_history,
-                        max_commits=50
-                    )
-                    results.append(result)
-                    scanned += 1
-                    
-                    # Rate limiting
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"Error scanning {repo.full_name}: {e}")
-                    continue
-            
-            return results
+            return self._scan_repositories(repos, max_repos, scan_history)
             
         except GithubException as e:
             raise ValueError(f"GitHub API error: {e.data.get('message', str(e))}")
@@ -168,34 +298,7 @@ class GitHubScanner:
             org = self.github.get_organization(org_name)
             repos = org.get_repos(sort='updated', direction='desc')
             
-            results = []
-            scanned = 0
-            
-            for repo in repos:
-                if scanned >= max_repos:
-                    break
-                
-                if repo.private:
-                    continue
-                
-                try:
-                    print(f"\nScanning {repo.full_name}...")
-                    result = self.scan_repository(
-                        repo.full_name,
-                        scan_history=scan_history,
-                        max_commits=50
-                    )
-                    results.append(result)
-                    scanned += 1
-                    
-                    # Rate limiting
-                    time.sleep(1)
-                    
-                except Exception as e:
-                    print(f"Error scanning {repo.full_name}: {e}")
-                    continue
-            
-            return results
+            return self._scan_repositories(repos, max_repos, scan_history)
             
         except GithubException as e:
             raise ValueError(f"GitHub API error: {e.data.get('message', str(e))}")
@@ -220,45 +323,95 @@ class GitHubScanner:
         try:
             repos = self.github.search_repositories(query=query, sort='stars', order='desc')
             
-            results = []
-            scanned = 0
-            
-            for repo in repos:
-                if scanned >= max_repos:
-                    break
-                
-                if repo.private:
-                    continue
-                
-                try:
-                    print(f"\nScanning {repo.full_name}...")
-                    result = self.scan_repository(
-                        repo.full_name,
-                        scan_history=scan_history,
-                        max_commits=50
-                    )
-                    results.append(result)
-                    scanned += 1
-                    
-                    # Rate limiting
-                    time.sleep(2)
-                    
-                except Exception as e:
-                    print(f"Error scanning {repo.full_name}: {e}")
-                    continue
-            
-            return results
+            return self._scan_repositories(repos, max_repos, scan_history)
             
         except GithubException as e:
             raise ValueError(f"GitHub API error: {e.data.get('message', str(e))}")
     
+    def _scan_repositories(
+        self,
+        repos: Iterable[Repository.Repository],
+        max_repos: int,
+        scan_history: bool
+    ) -> List[Dict]:
+        """
+        Clone and scan public repositories concurrently.
+        
+        Repositories are taken from `repos` in order until `max_repos` scans
+        have succeeded; a failed scan frees its slot for the next repository.
+        
+        Args:
+            repos: Repositories to scan, in priority order
+            max_repos: Maximum number of successful scans
+            scan_history: Whether to scan Git history
+            
+        Returns:
+            List of scan results, in the order of `repos`
+        """
+        candidates = (repo for repo in repos if not repo.private)
+        results = {}
+        pending = {}
+        index = 0
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                # Keep enough scans queued to reach max_repos if they all succeed
+                while len(results) + len(pending) < max_repos:
+                    repo = next(candidates, None)
+                    if repo is None:
+                        break
+                    
+                    self._respect_rate_limit()
+                    print(f"\nScanning {repo.full_name}...")
+                    future = executor.submit(self._scan_repo, repo, scan_history, 50)
+                    pending[future] = (index, repo)
+                    index += 1
+                
+                if not pending:
+                    break
+                
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    position, repo = pending.pop(future)
+                    try:
+                        results[position] = future.result()
+                    except Exception as e:
+                        print(f"Error scanning {repo.full_name}: {e}")
+        
+        return [results[position] for position in sorted(results)]
+    
+    def _respect_rate_limit(self) -> None:
+        """
+        Wait for the rate-limit reset if the core quota is nearly exhausted.
+        
+        Reads the counters PyGithub keeps from response headers, so checking
+        costs no request and only sleeps when the quota actually runs low.
+        """
+        remaining, _ = self.github.rate_limiting
+        if remaining >= RATE_LIMIT_FLOOR:
+            return
+        
+        wait_seconds = self.github.rate_limiting_resettime - time.time()
+        if wait_seconds > 0:
+            print(f"Rate limit nearly exhausted, waiting {wait_seconds:.0f}s for reset...")
+            time.sleep(wait_seconds + 1)
+    
     def get_rate_limit(self) -> Dict:
-        """Get current GitHub API rate limit status."""
+        """
+        Get current GitHub API rate limit status.
+        
+        Results are reused for RATE_LIMIT_TTL seconds so frequent polling
+        does not cost a round trip each time.
+        """
+        now = time.monotonic()
+        if self._rate_limit_cache and now - self._rate_limit_cache[0] < RATE_LIMIT_TTL:
+            return self._rate_limit_cache[1]
+        
         try:
             rate_limit = self.github.get_rate_limit()
             # Access the rate limit data via resources
             resources = rate_limit.resources
-            return {
+            status = {
                 "core": {
                     "limit": resources.core.limit,
                     "remaining": resources.core.remaining,
@@ -270,6 +423,8 @@ class GitHubScanner:
                     "reset": resources.search.reset
                 }
             }
+            self._rate_limit_cache = (now, status)
+            return status
         except (AttributeError, Exception) as e:
             # Fallback if rate limit structure is different
             return {
@@ -286,6 +441,7 @@ class GitHubScanner:
             }
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def _parse_repo_url(repo_url: str) -> str:
         """
         Parse GitHub repository URL to owner/repo format.
@@ -295,15 +451,12 @@ class GitHubScanner:
             
         Returns:
             owner/repo format
+            
+        Raises:
+            ValueError: If the URL does not name a repository
         """
-        # Already in owner/repo format
-        if '/' in repo_url and not repo_url.startswith('http'):
-            return repo_url
-        
-        # Parse from URL
-        if 'github.com' in repo_url:
-            parts = repo_url.rstrip('/').split('/')
-            if len(parts) >= 2:
-                return f"{parts[-2]}/{parts[-1].replace('.git', '')}"
+        match = REPO_URL_PATTERN.match(repo_url.strip())
+        if not match:
+            raise ValueError(f"Invalid repository URL or format: {repo_url}")
         
-        raise ValueError(f"Invalid repository URL or format: {repo_url}")
+        return f"{match[1]}/{match[2]}"
@@ -0,0 +1,164 @@
+"""Optional Hyperscan prefilter that narrows which rules can match a text."""
+
+import re
+import threading
+from typing import Any, Dict, List, Optional, Pattern, Set, Tuple
+
+try:
+    import hyperscan  # Optional: multi-pattern matching (install the "hyperscan" extra)
+except ImportError:
+    hyperscan = None
+
+# Syntax re accepts but PCRE reads differently: {,n} is a literal in PCRE,
+# so Hyperscan would miss matches; rules using it always run
+_PCRE_MISMATCH = re.compile(r'\{,\d')
+
+
+def _literal_expression(text: str) -> bytes:
+    """PCRE expression matching an ASCII string literally."""
+    return ''.join(c if c.isalnum() else '\\' + c for c in text).encode('ascii')
+
+
+def _prefilter_flags() -> int:
+    # Report each rule once, match like the re engine does on str content,
+    # and approximate constructs Hyperscan cannot run exactly (lookaround,
+    # back-references) with a pattern that matches a superset
+    return (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_MULTILINE
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_PREFILTER
+        | hyperscan.HS_FLAG_ALLOWEMPTY
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+
+
+class RulePrefilter:
+    """
+    Find the rules that may match a text in a single Hyperscan pass.
+    
+    The database never misses a rule the exact regex would match, so rules
+    it does not report can be skipped. Rules Hyperscan cannot compile at
+    all are always reported.
+    
+    Rule keywords are compiled into the same database, so on ASCII content
+    the pass also drops rules none of whose keywords occur.
+    """
+    
+    def __init__(self, compiled_rules: List[Tuple[Dict[str, Any], Pattern]]):
+        """
+        Args:
+            compiled_rules: (rule, pattern) pairs, as in Config.patterns
+        """
+        flags = _prefilter_flags()
+        expressions = {}
+        self.always: Set[int] = set()
+        self._rule_count = len(compiled_rules)
+        
+        # Keyword literals get ids after the rules, one per distinct keyword
+        keyword_ids: Dict[str, int] = {}
+        self._rule_keywords: Dict[int, Set[int]] = {}
+        
+        for index, (rule, _) in enumerate(compiled_rules):
+            if _PCRE_MISMATCH.search(rule['regex']):
+                self.always.add(index)
+            else:
+                expressions[index] = rule['regex'].encode('utf-8')
+            
+            keywords = [kw.lower() for kw in rule.get('keywords') or []]
+            # An empty keyword is in every text, so the rule is not filtered
+            if not keywords or '' in keywords:
+                continue
+            
+            # A non-ASCII keyword never occurs in ASCII content, the only
+            # content keyword hits are trusted for, so it needs no expression
+            ids = set()
+            for kw in keywords:
+                if not kw.isascii():
+                    continue
+                if kw not in keyword_ids:
+                    keyword_ids[kw] = self._rule_count + len(keyword_ids)
+                    expressions[keyword_ids[kw]] = _literal_expression(kw)
+                ids.add(keyword_ids[kw])
+            self._rule_keywords[index] = ids
+        
+        self._database = None
+        
+        if expressions:
+            try:
+                self._database = self._compile(expressions, flags)
+            except hyperscan.error:
+                # Find the offending expressions one by one and leave them to re
+                for index in list(expressions):
+                    try:
+                        self._compile({index: expressions[index]}, flags)
+                    except hyperscan.error:
+                        self.always.add(index)
+                        del expressions[index]
+                
+                if expressions:
+                    self._database = self._compile(expressions, flags)
+        
+        # Scratch space cannot be shared between concurrent scans
+        self._local = threading.local()
+    
+    @staticmethod
+    def _compile(expressions: Dict[int, bytes], flags: int) -> "hyperscan.Database":
+        database = hyperscan.Database()
+        database.compile(
+            expressions=list(expressions.values()),
+            ids=list(expressions),
+            flags=[flags] * len(expressions)
+        )
+        return database
+    
+    def candidates(self, content: str) -> Set[int]:
+        """
+        Indexes of the rules that may match content.
+        
+        Args:
+            content: Text content to scan
+        
+        Returns:
+            Set of indexes into the compiled rules
+        """
+        matched = set(self.always)
+        if self._database is not None:
+            scratch = getattr(self._local, 'scratch', None)
+            if scratch is None:
+                scratch = self._local.scratch = hyperscan.Scratch(self._database)
+            
+            def on_match(index, start, end, flags, context):
+                matched.add(index)
+            
+            self._database.scan(
+                content.encode('utf-8', errors='replace'),
+                match_event_handler=on_match,
+                scratch=scratch
+            )
+        
+        # Caseless literal hits equal `keyword in content.lower()` only for
+        # ASCII content; otherwise the scanner checks keywords itself
+        if self._rule_keywords and content.isascii():
+            for index, ids in self._rule_keywords.items():
+                if index in matched and matched.isdisjoint(ids):
+                    matched.discard(index)
+        
+        return {index for index in matched if index < self._rule_count}
+
+
+def build_prefilter(compiled_rules: List[Tuple[Dict[str, Any], Pattern]]) -> Optional[RulePrefilter]:
+    """
+    Build a prefilter for the rules when Hyperscan is installed.
+    
+    Args:
+        compiled_rules: (rule, pattern) pairs, as in Config.patterns
+    
+    Returns:
+        RulePrefilter, or None if Hyperscan is unavailable or there are no rules
+    """
+    if hyperscan is None or not compiled_rules:
+        return None
+    
+    return RulePrefilter(compiled_rules)
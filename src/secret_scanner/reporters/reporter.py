@@ -1,21 +1,93 @@
 """Reporter module for formatting and displaying scan results."""
 
 import json
-from typing import List
+import sys
+from typing import Any, Iterable, List
 from colorama import Fore, Style, init
 
-from .scanner import Finding
+from ..scanner import Finding
+
+try:
+    import orjson  # Optional: faster JSON encoding (install the "fast" extra)
+except ImportError:
+    orjson = None
 
 # Initialize colorama for cross-platform colored output
 init(autoreset=True)
 
 
+def _dumps(data: Any, pretty: bool) -> bytes:
+    """Encode data as UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(data, indent=2 if pretty else None).encode('utf-8')
+
+
+def _write(chunk: bytes) -> None:
+    """Write encoded output to stdout, bypassing the text layer when possible."""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    
+    if buffer is not None:
+        buffer.write(chunk)
+    else:
+        sys.stdout.write(chunk.decode('utf-8'))
+
+
+def _write_array(items: Iterable[Any], depth: int, pretty: bool) -> int:
+    """
+    Write the elements and closing bracket of a JSON array already opened.
+    
+    Each item is encoded as it arrives, so the array is never held whole.
+    
+    Args:
+        items: Values to encode
+        depth: Nesting depth of the elements, for pretty indentation
+        pretty: Indent to match a pretty-printed document
+        
+    Returns:
+        Number of items written
+    """
+    if pretty:
+        pad = b'\n' + b'  ' * depth
+        sep, close = b',' + pad, b'\n' + b'  ' * (depth - 1) + b']'
+    else:
+        pad, sep, close = b'', b', ', b']'
+    
+    count = 0
+    for item in items:
+        data = _dumps(item, pretty)
+        if pretty:
+            data = data.replace(b'\n', pad)
+        _write((sep if count else pad) + data)
+        count += 1
+    
+    # An empty array closes on the same line it opens
+    _write(close if count else b']')
+    return count
+
+
 class Reporter:
     """Base reporter class."""
     
     def report(self, findings: List[Finding]) -> None:
         """Generate and output report."""
         raise NotImplementedError
+    
+    def stream(self, findings: Iterable[Finding]) -> int:
+        """
+        Report findings from an iterator as the scan produces them.
+        
+        Formats that need every finding up front collect them first.
+        
+        Args:
+            findings: Iterable of Finding objects to report
+            
+        Returns:
+            Number of findings reported
+        """
+        findings = list(findings)
+        self.report(findings)
+        return len(findings)
 
 
 class ConsoleReporter(Reporter):
@@ -31,59 +103,96 @@ class ConsoleReporter(Reporter):
         Args:
             findings: List of Finding objects to report
         """
-        if not findings:
-            print(f"{Fore.GREEN}✓ No secrets detected!{Style.RESET_ALL}")
-            return
+        self.stream(findings)
+    
+    def stream(self, findings: Iterable[Finding]) -> int:
+        """
+        Print each finding as soon as it is produced.
         
-        # Group by severity/type
-        print(f"\n{Fore.RED}{'=' * 70}")
-        print(f"  SECRETS DETECTED: {len(findings)} finding(s)")
-        print(f"{'=' * 70}{Style.RESET_ALL}\n")
+        Args:
+            findings: Iterable of Finding objects to report
+            
+        Returns:
+            Number of findings reported
+        """
+        total = 0
+        file_counts = {}
+        current_group = None
         
-        # Group findings by file for better readability
-        findings_by_file = {}
         for finding in findings:
-            key = finding.file_path
-            if key not in findings_by_file:
-                findings_by_file[key] = []
-            findings_by_file[key].append(finding)
-        
-        for file_path, file_findings in findings_by_file.items():
-            print(f"{Fore.CYAN}📁 {file_path}{Style.RESET_ALL}")
-            print(f"{Fore.CYAN}   {len(file_findings)} finding(s){Style.RESET_ALL}\n")
+            # Build each finding's block and write it at once: one write per
+            # finding rather than one per line, which matters on a TTY
+            parts = []
+            
+            if not total:
+                parts.append(f"\n{Fore.RED}{'=' * 70}\n")
+                parts.append("  SECRETS DETECTED\n")
+                parts.append(f"{'=' * 70}{Style.RESET_ALL}\n\n")
             
-            for finding in file_findings:
-                self._print_finding(finding)
-                print()  # Blank line between findings
+            # File scans arrive grouped by file, history scans by commit and
+            # then file; print a header when that group changes
+            group = (finding.file_path, finding.commit_hash)
+            if group != current_group:
+                current_group = group
+                header = finding.file_path
+                if finding.commit_hash:
+                    header += f" @ {finding.commit_hash[:8]}"
+                parts.append(f"{Fore.CYAN}📁 {header}{Style.RESET_ALL}\n\n")
+            
+            parts.append(self._format_finding(finding))
+            parts.append("\n")  # Blank line between findings
+            sys.stdout.write("".join(parts))
+            file_counts[finding.file_path] = file_counts.get(finding.file_path, 0) + 1
+            total += 1
         
-        # Summary
-        print(f"{Fore.RED}{'=' * 70}")
-        print(f"  TOTAL: {len(findings)} secret(s) found across {len(findings_by_file)} file(s)")
-        print(f"{'=' * 70}{Style.RESET_ALL}\n")
+        if not total:
+            print(f"{Fore.GREEN}✓ No secrets detected!{Style.RESET_ALL}")
+            return 0
         
-        print(f"{Fore.YELLOW}⚠  Action required: Review and remove these secrets!{Style.RESET_ALL}\n")
+        # Summary: totals are only known once the stream is exhausted
+        per_file = "".join(
+            f"{Fore.CYAN}📁 {file_path}: {count} finding(s){Style.RESET_ALL}\n"
+            for file_path, count in file_counts.items()
+        )
+        sys.stdout.write(
+            f"{Fore.RED}{'=' * 70}\n"
+            f"  SECRETS DETECTED: {total} finding(s)\n"
+            f"{'=' * 70}{Style.RESET_ALL}\n\n"
+            f"{per_file}\n"
+            f"{Fore.RED}{'=' * 70}\n"
+            f"  TOTAL: {total} secret(s) found across {len(file_counts)} file(s)\n"
+            f"{'=' * 70}{Style.RESET_ALL}\n\n"
+            f"{Fore.YELLOW}⚠  Action required: Review and remove these secrets!{Style.RESET_ALL}\n\n"
+        )
+        return total
     
-    def _print_finding(self, finding: Finding) -> None:
-        """Print a single finding with formatting."""
+    def _format_finding(self, finding: Finding) -> str:
+        """Format a single finding as indented lines, ending with a newline."""
         # Rule ID and description
-        print(f"  {Fore.RED}🔑 [{finding.rule_id}]{Style.RESET_ALL} {finding.description}")
+        lines = [f"  {Fore.RED}🔑 [{finding.rule_id}]{Style.RESET_ALL} {finding.description}"]
         
         # Line number
         if finding.line_number:
-            print(f"     Line: {Fore.YELLOW}{finding.line_number}{Style.RESET_ALL}")
+            lines.append(f"     Line: {Fore.YELLOW}{finding.line_number}{Style.RESET_ALL}")
         
         # Commit hash
         if finding.commit_hash:
-            print(f"     Commit: {Fore.MAGENTA}{finding.commit_hash[:8]}{Style.RESET_ALL}")
+            lines.append(f"     Commit: {Fore.MAGENTA}{finding.commit_hash[:8]}{Style.RESET_ALL}")
         
         # Entropy
         if finding.entropy and self.verbose:
             color = Fore.RED if finding.entropy > 4.0 else Fore.YELLOW
-            print(f"     Entropy: {color}{finding.entropy:.2f}{Style.RESET_ALL}")
+            lines.append(f"     Entropy: {color}{finding.entropy:.2f}{Style.RESET_ALL}")
+        
+        # Repeats of the same secret in this file
+        if finding.occurrences > 1:
+            lines.append(f"     Occurrences: {Fore.YELLOW}{finding.occurrences}{Style.RESET_ALL}")
         
         # Secret preview (truncated)
         display_secret = finding.secret[:60] + "..." if len(finding.secret) > 60 else finding.secret
-        print(f"     {Fore.WHITE}{Style.DIM}Secret: {display_secret}{Style.RESET_ALL}")
+        lines.append(f"     {Fore.WHITE}{Style.DIM}Secret: {display_secret}{Style.RESET_ALL}")
+        
+        return "\n".join(lines) + "\n"
 
 
 class JSONReporter(Reporter):
@@ -99,15 +208,34 @@ class JSONReporter(Reporter):
         Args:
             findings: List of Finding objects to report
         """
-        output = {
-            "total_findings": len(findings),
-            "findings": [f.to_dict() for f in findings]
-        }
+        self.stream(findings)
+    
+    def stream(self, findings: Iterable[Finding]) -> int:
+        """
+        Output findings as JSON, writing each one as it is produced.
+        
+        The document has the same shape as a buffered dump, with
+        total_findings placed after the findings array.
+        
+        Args:
+            findings: Iterable of Finding objects to report
+            
+        Returns:
+            Number of findings reported
+        """
+        # Pending text output must not end up after our byte writes
+        sys.stdout.flush()
+        
+        _write(b'{\n  "findings": [' if self.pretty else b'{"findings": [')
+        total = _write_array((f.to_dict() for f in findings), 2, self.pretty)
         
         if self.pretty:
-            print(json.dumps(output, indent=2))
+            _write(b',\n  "total_findings": %d\n}\n' % total)
         else:
-            print(json.dumps(output))
+            _write(b', "total_findings": %d}\n' % total)
+        
+        sys.stdout.flush()
+        return total
 
 
 class SARIFReporter(Reporter):
@@ -120,35 +248,20 @@ class SARIFReporter(Reporter):
         Args:
             findings: List of Finding objects to report
         """
-        # Build SARIF results
-        results = []
-        for finding in findings:
-            result = {
-                "ruleId": finding.rule_id,
-                "level": "error",
-                "message": {
-                    "text": finding.description
-                },
-                "locations": [{
-                    "physicalLocation": {
-                        "artifactLocation": {
-                            "uri": finding.file_path
-                        },
-                        "region": {
-                            "startLine": finding.line_number or 1
-                        }
-                    }
-                }]
-            }
-            
-            if finding.commit_hash:
-                result["versionControlProvenance"] = [{
-                    "revisionId": finding.commit_hash
-                }]
-            
-            results.append(result)
+        self.stream(findings)
+    
+    def stream(self, findings: Iterable[Finding]) -> int:
+        """
+        Output findings in SARIF format, writing each result as it is produced.
         
-        # Build SARIF document
+        Args:
+            findings: Iterable of Finding objects to report
+            
+        Returns:
+            Number of findings reported
+        """
+        # Build SARIF document around an empty results array, which is
+        # then written element by element in its place
         sarif = {
             "$schema": "https://raw.githubusercontent.com/oasis-tcs/sarif-spec/master/Schemata/sarif-schema-2.1.0.json",
             "version": "2.1.0",
@@ -160,11 +273,49 @@ class SARIFReporter(Reporter):
                         "informationUri": "https://github.com/yourusername/secret-scanner"
                     }
                 },
-                "results": results
+                "results": []
+            }]
+        }
+        head, tail = _dumps(sarif, pretty=True).split(b'"results": []')
+        
+        sys.stdout.flush()
+        _write(head + b'"results": [')
+        # Results sit four levels deep: document, runs, run, results
+        total = _write_array((self._result(f) for f in findings), 4, pretty=True)
+        _write(tail + b'\n')
+        sys.stdout.flush()
+        return total
+    
+    @staticmethod
+    def _result(finding: Finding) -> dict:
+        """Build the SARIF result object for a finding."""
+        result = {
+            "ruleId": finding.rule_id,
+            "level": "error",
+            "message": {
+                "text": finding.description
+            },
+            "locations": [{
+                "physicalLocation": {
+                    "artifactLocation": {
+                        "uri": finding.file_path
+                    },
+                    "region": {
+                        "startLine": finding.line_number or 1
+                    }
+                }
             }]
         }
         
-        print(json.dumps(sarif, indent=2))
+        if finding.occurrences > 1:
+            result["occurrenceCount"] = finding.occurrences
+        
+        if finding.commit_hash:
+            result["versionControlProvenance"] = [{
+                "revisionId": finding.commit_hash
+            }]
+        
+        return result
 
 
 class SummaryReporter(Reporter):
@@ -187,10 +338,10 @@ class SummaryReporter(Reporter):
             rule_id = finding.rule_id
             rule_counts[rule_id] = rule_counts.get(rule_id, 0) + 1
         
-        print(f"\n⚠  {len(findings)} secret(s) detected:\n")
+        lines = [f"\n⚠  {len(findings)} secret(s) detected:\n"]
         for rule_id, count in sorted(rule_counts.items(), key=lambda x: x[1], reverse=True):
-            print(f"  • {rule_id}: {count}")
-        print()
+            lines.append(f"  • {rule_id}: {count}")
+        sys.stdout.write("\n".join(lines) + "\n\n")
 
 
 def get_reporter(format_type: str = "console", **kwargs) -> Reporter:
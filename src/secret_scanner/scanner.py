@@ -1,16 +1,29 @@
 """Core scanner module for detecting secrets in files and Git repositories."""
 
+import codecs
+import mmap
+import os
 import re
+import sys
+from collections import deque
+from itertools import chain, islice
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Optional, Iterator
+from typing import BinaryIO, Callable, Iterable, List, Dict, Optional, Iterator, Tuple, Pattern, Union
 from dataclasses import dataclass
-import git
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:
+    import sre_parse
 
 from .detectors.entropy import shannon_entropy
-from .config import Config
+from .config import Config, REGEX_FLAGS
+from .prefilter import RulePrefilter, build_prefilter
 
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     """Represents a detected secret or sensitive information."""
     
@@ -21,6 +34,7 @@ class Finding:
     line_number: Optional[int] = None
     commit_hash: Optional[str] = None
     entropy: Optional[float] = None
+    occurrences: int = 1
     
     def __str__(self):
         parts = [f"[{self.rule_id}] {self.description}"]
@@ -35,6 +49,9 @@ class Finding:
         if self.entropy:
             parts.append(f"\n  Entropy: {self.entropy:.2f}")
         
+        if self.occurrences > 1:
+            parts.append(f"\n  Occurrences: {self.occurrences}")
+        
         # Truncate secret for display (security)
         display_secret = self.secret[:60] + "..." if len(self.secret) > 60 else self.secret
         parts.append(f"\n  Secret: {display_secret}")
@@ -50,10 +67,35 @@ class Finding:
             "line_number": self.line_number,
             "commit_hash": self.commit_hash,
             "entropy": round(self.entropy, 2) if self.entropy else None,
+            "occurrences": self.occurrences,
             "secret_preview": self.secret[:20] + "..." if len(self.secret) > 20 else self.secret
         }
 
 
+# Common binary extensions
+BINARY_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg', '.webp', '.tiff',
+    '.pdf', '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z', '.jar', '.war', '.whl',
+    '.exe', '.dll', '.so', '.dylib', '.bin',
+    '.pyc', '.pyo', '.class', '.o', '.a',
+    '.woff', '.woff2', '.ttf', '.otf', '.eot',
+    '.mp3', '.mp4', '.wav', '.ogg', '.mov', '.avi'
+})
+
+# Common source and config extensions, trusted as text without sniffing
+TEXT_EXTENSIONS = frozenset({
+    '.py', '.pyi', '.js', '.jsx', '.mjs', '.cjs', '.ts', '.tsx', '.go', '.rs',
+    '.java', '.kt', '.scala', '.rb', '.php', '.cs', '.c', '.h', '.cc', '.cpp',
+    '.hpp', '.swift', '.sh', '.bash', '.zsh', '.ps1', '.sql', '.tf', '.hcl',
+    '.md', '.rst', '.txt', '.html', '.css', '.scss', '.vue', '.xml',
+    '.json', '.yml', '.yaml', '.toml', '.ini', '.cfg', '.conf', '.env',
+    '.properties', '.gradle', '.lock'
+})
+
+# Leading bytes checked for null bytes when deciding if a file is binary
+BINARY_SNIFF_BYTES = 8192
+
+
 def should_skip_path(path: str, exclusions: List[str]) -> bool:
     """
     Check if a file path should be skipped based on exclusion patterns.
@@ -61,43 +103,112 @@ def should_skip_path(path: str, exclusions: List[str]) -> bool:
     Args:
         path: File path to check
         exclusions: List of regex patterns to match against
-        
+    
     Returns:
         True if path should be skipped
     """
-    return any(re.search(pattern, path) for pattern in exclusions)
+    if not exclusions:
+        return False
+    return _exclusion_matcher(tuple(exclusions))(path)
+
+
+@lru_cache(maxsize=64)
+def _exclusion_matcher(exclusions: Tuple[str, ...]) -> Callable[[str], bool]:
+    """Build a predicate matching a path if any exclusion pattern does."""
+    if not exclusions:
+        return lambda path: False
+    
+    try:
+        # One search over a single alternation instead of one per pattern
+        combined = re.compile('|'.join(f'(?:{pattern})' for pattern in exclusions))
+    except re.error:
+        # Global inline flags such as (?i) cannot be nested in an
+        # alternation; match those pattern by pattern
+        patterns = [re.compile(pattern) for pattern in exclusions]
+        return lambda path: any(pattern.search(path) for pattern in patterns)
+    
+    return lambda path: combined.search(path) is not None
+
+
+def _extension(path: str) -> str:
+    """Lowercased extension of a path string, e.g. '.py', without building a Path."""
+    return os.path.splitext(path)[1].lower()
 
 
-def is_binary_file(file_path: Path) -> bool:
+def is_binary_file(file_path: Union[str, Path]) -> bool:
     """
     Check if a file is binary (heuristic check).
     
     Args:
         file_path: Path to file
-        
+    
     Returns:
         True if file appears to be binary
     """
-    # Common binary extensions
-    binary_extensions = {
-        '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.ico', '.svg',
-        '.pdf', '.zip', '.tar', '.gz', '.bz2', '.xz', '.7z',
-        '.exe', '.dll', '.so', '.dylib', '.bin',
-        '.pyc', '.pyo', '.class', '.o', '.a'
-    }
-    
-    if file_path.suffix.lower() in binary_extensions:
+    suffix = _extension(os.fspath(file_path))
+    if suffix in TEXT_EXTENSIONS:
+        return False
+    if suffix in BINARY_EXTENSIONS:
         return True
     
     # Check file content for null bytes
     try:
         with open(file_path, 'rb') as f:
-            chunk = f.read(8192)
+            chunk = f.read(BINARY_SNIFF_BYTES)
             return b'\x00' in chunk
     except Exception:
         return True
 
 
+@lru_cache(maxsize=1024)
+def _compile_regex(regex: str) -> Pattern:
+    """Compile a rule regex once per process for callers passing raw rules."""
+    return re.compile(regex, REGEX_FLAGS)
+
+
+@lru_cache(maxsize=16)
+def _rules_prefilter(rules: Tuple[Tuple[str, Tuple[str, ...]], ...]) -> Optional[RulePrefilter]:
+    """Build the Hyperscan prefilter once per distinct rule set for raw-rule callers."""
+    return build_prefilter([
+        ({'regex': regex, 'keywords': list(keywords)}, _compile_regex(regex))
+        for regex, keywords in rules
+    ])
+
+
+@lru_cache(maxsize=1024)
+def _required_literal(regex: str) -> str:
+    """
+    Longest lowercased literal text every match of a rule regex contains.
+    
+    Args:
+        regex: Rule regex, compiled with REGEX_FLAGS
+    
+    Returns:
+        The literal (e.g. 'ghp_', or '://' for database URLs), or '' if the
+        regex has none
+    """
+    def ops(parsed):
+        # Groups are matched exactly once, so their contents join the
+        # surrounding sequence
+        for op, value in parsed:
+            if op == sre_parse.SUBPATTERN:
+                yield from ops(value[-1])
+            else:
+                yield op, value
+    
+    longest = ''
+    run = []
+    for op, value in chain(ops(sre_parse.parse(regex, REGEX_FLAGS)), [(None, None)]):
+        if op == sre_parse.LITERAL and chr(value).isascii():
+            run.append(chr(value))
+            continue
+        if len(run) > len(longest):
+            longest = ''.join(run)
+        run = []
+    
+    return longest.lower()
+
+
 def scan_content(
     content: str,
     rules: List[Dict],
@@ -114,46 +225,119 @@ def scan_content(
         file_path: Path to file being scanned (for reporting)
         commit_hash: Git commit hash if scanning history
         exclusions: List of path exclusion patterns
-        
+    
     Returns:
         List of Finding objects
     """
     if exclusions and should_skip_path(file_path, exclusions):
         return []
     
-    findings = []
-    
+    compiled_rules = []
     for rule in rules:
         try:
-            pattern = re.compile(rule['regex'], re.IGNORECASE | re.MULTILINE)
+            pattern = _compile_regex(rule['regex'])
         except re.error as e:
-            print(f"Warning: Invalid regex in rule '{rule['id']}': {e}")
+            print(f"Warning: Invalid regex in rule '{rule['id']}': {e}", file=sys.stderr)
+            continue
+        compiled_rules.append((rule, pattern))
+    
+    prefilter = _rules_prefilter(tuple(
+        (rule['regex'], tuple(rule.get('keywords') or ()))
+        for rule, _ in compiled_rules
+    ))
+    return _scan_compiled(content, compiled_rules, file_path, commit_hash, prefilter)
+
+
+def _scan_compiled(
+    content: str,
+    compiled_rules: List[Tuple[Dict, Pattern]],
+    file_path: str,
+    commit_hash: Optional[str] = None,
+    prefilter: Optional[RulePrefilter] = None
+) -> List[Finding]:
+    """Scan text content against already-compiled (rule, pattern) pairs."""
+    findings = []
+    lowered = None
+    is_ascii = content.isascii()
+    keyword_hits: Dict[str, bool] = {}
+    
+    # One multi-pattern pass rules out most regexes when hyperscan is
+    # installed, and on ASCII content applies the keyword filter as well
+    candidates = prefilter.candidates(content) if prefilter else None
+    keywords_checked = candidates is not None and is_ascii
+    
+    for index, (rule, pattern) in enumerate(compiled_rules):
+        if candidates is not None and index not in candidates:
             continue
         
-        # Pre-filter by keywords if specified (performance optimization)
+        # Pre-filter by keywords if specified (performance optimization);
+        # content is lowered once and each distinct keyword searched once
         keywords = rule.get('keywords', [])
-        if keywords:
-            has_keyword = any(kw.lower() in content.lower() for kw in keywords)
+        if keywords and not keywords_checked:
+            # str.lower() has a C fast path for ASCII and, unlike an ASCII
+            # translate table, folds case the way IGNORECASE matching does
+            if lowered is None:
+                lowered = content.lower()
+            
+            has_keyword = False
+            for kw in keywords:
+                hit = keyword_hits.get(kw)
+                if hit is None:
+                    hit = keyword_hits[kw] = kw.lower() in lowered
+                if hit:
+                    has_keyword = True
+                    break
+            
             if not has_keyword:
                 continue
         
+        # Skip rules whose required literal (e.g. ghp_, ://) is absent;
+        # a substring search is far cheaper than running the regex. For ASCII
+        # content, IGNORECASE matching reduces to comparing lowered text
+        literal = _required_literal(rule['regex'])
+        if literal and is_ascii:
+            if lowered is None:
+                lowered = content.lower()
+            if literal not in lowered:
+                continue
+        
+        # Per-rule values, looked up once rather than for every match
+        rule_id = rule['id']
+        description = rule.get('description', rule_id)
+        min_entropy = rule.get('entropy')
+        
+        # Matches come in offset order, so line numbers are found by
+        # counting newlines since the previous match, in C
+        line_number = 1
+        line_offset = 0
+        
+        # Repeats of a secret within the content are counted on the finding
+        # for its first occurrence rather than reported again
+        reported: Dict[str, Finding] = {}
+        
         for match in pattern.finditer(content):
             secret = match.group(0)
             
-            # Calculate entropy
+            first = reported.get(secret)
+            if first is not None:
+                first.occurrences += 1
+                continue
+            
+            # Calculate entropy; findings always report it, so it is
+            # needed even when the rule has no threshold
             ent = shannon_entropy(secret)
-            min_entropy = rule.get('entropy')
             
             # Filter by entropy threshold if specified
             if min_entropy is not None and ent < min_entropy:
                 continue
             
-            # Find line number
-            line_number = content[:match.start()].count('\n') + 1
+            start = match.start()
+            line_number += content.count('\n', line_offset, start)
+            line_offset = start
             
             finding = Finding(
-                rule_id=rule['id'],
-                description=rule.get('description', rule['id']),
+                rule_id=rule_id,
+                description=description,
                 secret=secret,
                 file_path=file_path,
                 line_number=line_number,
@@ -162,10 +346,30 @@ def scan_content(
             )
             
             findings.append(finding)
+            reported[secret] = finding
     
     return findings
 
 
+def _decode_text(data) -> str:
+    """
+    Decode file bytes the way text-mode open() reads them.
+    
+    Invalid UTF-8 is dropped and CRLF and lone CR line endings become LF,
+    so line numbers count CR-only files and matches never end in a stray CR.
+    
+    Args:
+        data: bytes or another buffer, such as an mmap
+    
+    Returns:
+        Decoded text with universal newlines
+    """
+    content = str(data, 'utf-8', 'ignore')
+    if '\r' in content:
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return content
+
+
 def scan_file(file_path: Path, config: Config) -> List[Finding]:
     """
     Scan a single file for secrets.
@@ -173,63 +377,276 @@ def scan_file(file_path: Path, config: Config) -> List[Finding]:
     Args:
         file_path: Path to file to scan
         config: Configuration object with rules and exclusions
-        
+    
     Returns:
         List of Finding objects
     """
     if not file_path.is_file():
         return []
     
+    path = str(file_path)
+    
     # Check exclusions
-    if should_skip_path(str(file_path), config.exclusions):
+    if should_skip_path(path, config.exclusions):
         return []
     
-    # Skip binary files
-    if is_binary_file(file_path):
+    # Skip binary files by extension before opening them
+    suffix = _extension(path)
+    if suffix in BINARY_EXTENSIONS:
         return []
     
-    # Read file content
+    # Decode straight from a read-only mapping: no intermediate read buffer,
+    # and the null-byte sniff for unknown extensions shares the same open
     try:
-        with open(file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            content = f.read()
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if suffix not in TEXT_EXTENSIONS and mm.find(b'\x00', 0, BINARY_SNIFF_BYTES) != -1:
+                    return []
+                content = _decode_text(mm)
     except Exception as e:
-        print(f"Warning: Could not read {file_path}: {e}")
+        # stderr, so the warning cannot end up inside JSON or SARIF on stdout
+        print(f"Warning: Could not read {file_path}: {e}", file=sys.stderr)
         return []
     
-    return scan_content(
-        content,
-        config.rules,
-        file_path=str(file_path),
-        exclusions=config.exclusions
-    )
+    return _scan_compiled(content, config.patterns, path, prefilter=config.prefilter)
 
 
-def scan_directory(directory: Path, config: Config) -> List[Finding]:
+def scan_bytes(file_path: str, data: bytes, config: Config) -> List[Finding]:
     """
-    Recursively scan a directory for secrets.
+    Scan an in-memory file, such as a member of a downloaded archive.
+    
+    Applies the same exclusion and binary checks as scan_file.
     
     Args:
-        directory: Path to directory to scan
+        file_path: Path to report findings against
+        data: Raw file contents
         config: Configuration object with rules and exclusions
-        
+    
+    Returns:
+        List of Finding objects
+    """
+    if should_skip_path(file_path, config.exclusions):
+        return []
+    
+    if _extension(file_path) in BINARY_EXTENSIONS or b'\x00' in data[:BINARY_SNIFF_BYTES]:
+        return []
+    
+    content = _decode_text(data)
+    return _scan_compiled(content, config.patterns, file_path, prefilter=config.prefilter)
+
+
+def scan_stream(file_path: str, stream: BinaryIO, config: Config) -> List[Finding]:
+    """
+    Scan a file read from a stream, such as a member of a streamed archive.
+    
+    Exclusions and binary extensions are checked before anything is read,
+    and only the first BINARY_SNIFF_BYTES are read before the null-byte
+    check, so skipped files are never loaded into memory.
+    
+    Args:
+        file_path: Path to report findings against
+        stream: Binary file object positioned at the start of the file
+        config: Configuration object with rules and exclusions
+    
     Returns:
         List of Finding objects
     """
+    if should_skip_path(file_path, config.exclusions) or _extension(file_path) in BINARY_EXTENSIONS:
+        return []
+    
+    head = stream.read(BINARY_SNIFF_BYTES)
+    if b'\x00' in head:
+        return []
+    
+    content = _decode_text(head + stream.read())
+    return _scan_compiled(content, config.patterns, file_path, prefilter=config.prefilter)
+
+
+# Files (or per-file history patches) handed to a worker process per task
+FILES_PER_TASK = 32
+
+# Config of the current worker process, set once by _init_worker
+_worker_config: Optional[Config] = None
+
+
+def available_cpus() -> int:
+    """
+    Number of CPUs this process may run on.
+    
+    Honours CPU affinity (taskset, container cpusets), which os.cpu_count()
+    ignores, so --jobs 0 does not oversubscribe a pinned CI runner.
+    
+    Returns:
+        CPU count, at least 1
+    """
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0)) or 1
+    return os.cpu_count() or 1
+
+
+def _init_worker(config: Config) -> None:
+    """Process pool initializer: receive the config once per worker."""
+    global _worker_config
+    _worker_config = config
+
+
+def _scan_files(paths: List[Path], config: Optional[Config] = None) -> List[Finding]:
+    """Scan a batch of files; worker processes use the config from _init_worker."""
+    if config is None:
+        config = _worker_config
+    
     all_findings = []
     
-    for file_path in directory.rglob('*'):
-        if file_path.is_file():
-            findings = scan_file(file_path, config)
-            all_findings.extend(findings)
+    for file_path in paths:
+        findings = scan_file(file_path, config)
+        all_findings.extend(findings)
     
     return all_findings
 
 
+def scan_directory(directory: Path, config: Config, jobs: int = 1) -> List[Finding]:
+    """
+    Recursively scan a directory for secrets.
+    
+    Args:
+        directory: Path to directory to scan
+        config: Configuration object with rules and exclusions
+        jobs: Worker processes to scan files with (1 scans in-process)
+    
+    Returns:
+        List of Finding objects
+    """
+    return list(iter_directory(directory, config, jobs))
+
+
+def iter_directory(directory: Path, config: Config, jobs: int = 1) -> Iterator[Finding]:
+    """
+    Recursively scan a directory, yielding findings as each file is scanned.
+    
+    Args:
+        directory: Path to directory to scan
+        config: Configuration object with rules and exclusions
+        jobs: Worker processes to scan files with (1 scans in-process)
+    
+    Yields:
+        Finding objects, grouped by file
+    """
+    # Walk lazily so the first findings do not wait for the whole tree
+    files = _walk_files(directory, config.exclusions)
+    yield from _scan_batches(_scan_files, files, config, jobs)
+
+
+# Constructs that can stop matching once more path is appended: end
+# anchors, word boundaries and any (?...) group, lookarounds included
+_UNPRUNABLE_EXCLUSION = re.compile(r'\$|\(\?|\\[bBZ]')
+
+
+def _walk_files(directory: Path, exclusions: List[str]) -> Iterator[Path]:
+    """
+    Yield the files under a directory, skipping excluded subdirectories.
+    
+    os.scandir reports file types from the directory listing itself, so
+    this avoids a stat call per entry. A subdirectory whose path with a
+    trailing separator matches an exclusion (e.g. node_modules/) is not
+    entered at all, but only for exclusions that then match every path
+    below it; others, such as tests/(?!keep), are left to the per-file
+    check in scan_file. Symlinked directories are not followed.
+    
+    Args:
+        directory: Path to directory to walk
+        exclusions: List of regex patterns to match against
+    
+    Yields:
+        Path of each regular file
+    """
+    # Looked up once per walk rather than once per subdirectory
+    excluded = _exclusion_matcher(tuple(
+        pattern for pattern in exclusions
+        if not _UNPRUNABLE_EXCLUSION.search(pattern)
+    ))
+    stack = [str(directory)]
+    
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Unreadable directory; skip it like rglob does
+            continue
+        
+        subdirectories = []
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not excluded(entry.path + os.sep):
+                            subdirectories.append(entry.path)
+                    elif entry.is_file():
+                        yield Path(entry.path)
+                except OSError:
+                    continue
+        
+        # Reversed so subdirectories are visited in listing order
+        stack.extend(reversed(subdirectories))
+
+
+def _scan_batches(
+    worker: Callable[..., List[Finding]],
+    items: Iterator,
+    config: Config,
+    jobs: int
+) -> Iterator[Finding]:
+    """
+    Scan items with a batch worker, in worker processes when it pays off.
+    
+    Args:
+        worker: _scan_files or _scan_additions
+        items: Items the worker accepts a list of
+        config: Configuration object with rules and exclusions
+        jobs: Worker processes to use (1 scans in-process)
+    
+    Yields:
+        Finding objects in item order
+    """
+    # Small inputs are not worth the cost of starting workers
+    first = list(islice(items, FILES_PER_TASK + 1))
+    items = chain(first, items)
+    
+    if jobs <= 1 or len(first) <= FILES_PER_TASK:
+        for item in items:
+            yield from worker([item], config)
+        return
+    
+    pending = deque()
+    
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(config,)
+    ) as executor:
+        while True:
+            batch = list(islice(items, FILES_PER_TASK))
+            if not batch:
+                break
+            pending.append(executor.submit(worker, batch))
+            
+            # Keep a bounded number of batches in flight so a large tree or
+            # long history is never held in memory at once
+            if len(pending) >= jobs * 2:
+                yield from pending.popleft().result()
+        
+        while pending:
+            yield from pending.popleft().result()
+
+
 def scan_git_history(
     repo_path: Path,
     config: Config,
     max_commits: Optional[int] = None,
-    branch: str = "HEAD"
+    branch: str = "HEAD",
+    jobs: int = 1
 ) -> List[Finding]:
     """
     Scan Git commit history for secrets.
@@ -239,71 +656,172 @@ def scan_git_history(
         config: Configuration object with rules and exclusions
         max_commits: Maximum number of commits to scan (None for all)
         branch: Branch to scan (default: HEAD)
-        
+        jobs: Worker processes to scan patches with (1 scans in-process)
+    
     Returns:
         List of Finding objects
     """
+    return list(iter_git_history(repo_path, config, max_commits, branch, jobs))
+
+
+def iter_git_history(
+    repo_path: Path,
+    config: Config,
+    max_commits: Optional[int] = None,
+    branch: str = "HEAD",
+    jobs: int = 1
+) -> Iterator[Finding]:
+    """
+    Scan Git commit history, yielding findings commit by commit.
+    
+    Args:
+        repo_path: Path to Git repository
+        config: Configuration object with rules and exclusions
+        max_commits: Maximum number of commits to scan (None for all)
+        branch: Branch to scan (default: HEAD)
+        jobs: Worker processes to scan patches with (1 scans in-process)
+    
+    Yields:
+        Finding objects, newest commit first
+    """
+    import git  # gitpython is only needed for history scans
+    
     try:
         repo = git.Repo(repo_path)
     except git.exc.InvalidGitRepositoryError:
         raise ValueError(f"Not a valid Git repository: {repo_path}")
     
-    all_findings = []
+    # One streaming `git log -p` for the whole walk instead of a diff per
+    # commit; -U0 drops context lines, which are never scanned anyway
+    repo.git.set_persistent_git_options(c='core.quotePath=false')
+    process = repo.git.log(
+        branch,
+        patch=True,
+        unified='0',
+        no_color=True,
+        no_ext_diff=True,
+        diff_merges='first-parent',
+        # Explicit prefixes so diff.noprefix or diff.mnemonicPrefix in the
+        # user's config cannot change what _patch_path strips
+        src_prefix='a/',
+        dst_prefix='b/',
+        format='%x00%H',
+        max_count=max_commits,
+        as_process=True
+    )
     
-    # Get commits
-    commits = list(repo.iter_commits(branch, max_count=max_commits))
+    excluded = _exclusion_matcher(tuple(config.exclusions))
     
-    for commit in commits:
-        # Get parent (for diff)
-        parent = commit.parents[0] if commit.parents else git.NULL_TREE
-        
-        # Get diff
-        diffs = commit.diff(parent, create_patch=True)
+    try:
+        additions = (
+            addition for addition in _iter_patch_additions(process.proc.stdout)
+            if not excluded(addition[1])
+        )
+        yield from _scan_batches(_scan_additions, additions, config, jobs)
         
-        for diff in diffs:
-            # Skip binary files
-            if diff.diff is None:
-                continue
-            
-            file_path = diff.b_path if diff.b_path else diff.a_path
-            
-            # Check exclusions
-            if should_skip_path(file_path, config.exclusions):
-                continue
+        # Raises GitCommandError if git failed, e.g. on an unknown branch
+        process.wait()
+    finally:
+        # Stop git if the caller stopped consuming findings early
+        if process.proc.poll() is None:
+            process.proc.kill()
+            process.proc.wait()
+
+
+def _scan_additions(
+    additions: List[Tuple[str, str, List[str]]],
+    config: Optional[Config] = None
+) -> List[Finding]:
+    """Scan (commit, path, added lines) patches; workers use the config from _init_worker."""
+    if config is None:
+        config = _worker_config
+    
+    findings = []
+    
+    for commit_hash, file_path, added_lines in additions:
+        findings.extend(_scan_compiled(
+            '\n'.join(added_lines),
+            config.patterns,
+            file_path,
+            commit_hash=commit_hash,
+            prefilter=config.prefilter
+        ))
+    
+    return findings
+
+
+def _iter_patch_additions(lines: Iterable[bytes]) -> Iterator[Tuple[str, str, List[str]]]:
+    """
+    Parse `git log -p --format=%x00%H` output into the lines added per file.
+    
+    Args:
+        lines: Raw output lines; each commit starts with a NUL and its hash
+    
+    Yields:
+        (commit hash, file path, added lines) for every file with additions
+    """
+    commit_hash = None
+    file_path = None
+    added_lines: List[str] = []
+    in_hunk = False
+    
+    for line in lines:
+        if line.startswith(b'\x00') or line.startswith(b'diff --git '):
+            if file_path and added_lines:
+                yield commit_hash, file_path, added_lines
+            file_path, added_lines, in_hunk = None, [], False
             
-            try:
-                # Decode diff content
-                diff_text = diff.diff.decode('utf-8', errors='ignore')
-                
-                # Scan added lines (lines starting with +)
-                added_lines = []
-                for line in diff_text.split('\n'):
-                    if line.startswith('+') and not line.startswith('+++'):
-                        added_lines.append(line[1:])  # Remove + prefix
-                
-                if added_lines:
-                    content = '\n'.join(added_lines)
-                    findings = scan_content(
-                        content,
-                        config.rules,
-                        file_path=file_path,
-                        commit_hash=commit.hexsha,
-                        exclusions=config.exclusions
-                    )
-                    all_findings.extend(findings)
-                    
-            except Exception as e:
-                print(f"Warning: Error processing commit {commit.hexsha[:8]}: {e}")
-                continue
+            if line.startswith(b'\x00'):
+                commit_hash = line[1:].strip().decode('ascii')
+        elif in_hunk:
+            # Only hunk bodies can hold added lines, so an added line that
+            # itself starts with "++" is not mistaken for a header
+            if line.startswith(b'+'):
+                # CRLF files keep their \r in patches; drop it like the newline
+                added_lines.append(line[1:].rstrip(b'\r\n').decode('utf-8', errors='ignore'))
+        elif line.startswith(b'@@'):
+            in_hunk = True
+        elif line.startswith(b'+++ '):
+            file_path = _patch_path(line[4:].rstrip(b'\n'))
     
-    return all_findings
+    if file_path and added_lines:
+        yield commit_hash, file_path, added_lines
+
+
+def _patch_path(raw: bytes) -> Optional[str]:
+    """File path from a patch's '+++ b/<path>' header, or None for deletions."""
+    # Git ends the header with a tab when the path contains a space
+    if raw.endswith(b'\t'):
+        raw = raw[:-1]
+    
+    if raw.startswith(b'"'):
+        # Git C-quotes paths with control characters, quotes or backslashes
+        raw = codecs.escape_decode(raw[1:-1])[0]
+    
+    if raw == b'/dev/null':
+        return None
+    
+    return raw[2:].decode('utf-8', errors='ignore')
 
 
 class Scanner:
     """Main scanner class for orchestrating secret detection."""
     
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, jobs: int = 1):
+        """
+        Args:
+            config: Configuration object with rules and exclusions
+            jobs: Worker processes for directory and history scans (1 scans in-process)
+        
+        Raises:
+            ValueError: If a rule has an invalid regex
+        """
         self.config = config
+        self.jobs = jobs
+        
+        # Compile once up front: a bad rule fails here rather than partway
+        # through a scan or inside a worker process
+        config.compile()
     
     def scan(
         self,
@@ -318,20 +836,55 @@ class Scanner:
             target: Path to file, directory, or Git repository
             git_history: Whether to scan Git history
             max_commits: Maximum commits to scan (if git_history=True)
-            
+        
         Returns:
             List of Finding objects
         """
+        return list(self.iter_scan(target, git_history, max_commits))
+    
+    def iter_scan(
+        self,
+        target: Path,
+        git_history: bool = False,
+        max_commits: Optional[int] = None
+    ) -> Iterator[Finding]:
+        """
+        Scan a target path, yielding findings as they are found.
+        
+        Args:
+            target: Path to file, directory, or Git repository
+            git_history: Whether to scan Git history
+            max_commits: Maximum commits to scan (if git_history=True)
+        
+        Returns:
+            Iterator of Finding objects
+        
+        Raises:
+            FileNotFoundError: If the target does not exist
+        """
         target = Path(target)
         
         if not target.exists():
             raise FileNotFoundError(f"Target not found: {target}")
         
         if git_history:
-            return scan_git_history(target, self.config, max_commits)
+            return iter_git_history(target, self.config, max_commits, jobs=self.jobs)
         elif target.is_file():
-            return scan_file(target, self.config)
+            return iter(scan_file(target, self.config))
         elif target.is_dir():
-            return scan_directory(target, self.config)
+            return iter_directory(target, self.config, self.jobs)
         else:
             raise ValueError(f"Invalid target: {target}")
+    
+    def scan_bytes(self, file_path: str, data: bytes) -> List[Finding]:
+        """
+        Scan an in-memory file for secrets.
+        
+        Args:
+            file_path: Path to report findings against
+            data: Raw file contents
+        
+        Returns:
+            List of Finding objects
+        """
+        return scan_bytes(file_path, data, self.config)
@@ -2,22 +2,56 @@
 
 import streamlit as st
 import pandas as pd
+import numpy as np
 import plotly.express as px
 import plotly.graph_objects as go
 from pathlib import Path
+import shutil
 import tempfile
+import hashlib
+from importlib import resources
 import json
-from typing import List, Dict
+import uuid
+from collections import Counter
+from typing import List, Dict, NamedTuple, Optional, Tuple
 import os
 import sys
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from secret_scanner.config import load_rules, validate_config
+from secret_scanner.config import Config, DEFAULT_RULES, load_rules, validate_config
 from secret_scanner.scanner import Scanner, Finding
 from secret_scanner.github_scanner import GitHubScanner
 
+try:
+    import orjson  # Optional: faster JSON encoding (install the "fast" extra)
+except ImportError:
+    orjson = None
+
+
+# Buffer size for copying uploaded files to disk
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+# Findings table rows sent to the browser per page
+TABLE_PAGE_SIZE = 200
+
+# Column formatting for the findings table, applied by the browser instead
+# of a pandas Styler
+FINDINGS_COLUMN_CONFIG = {
+    "#": st.column_config.NumberColumn("#", format="%d", width="small"),
+    "Line": st.column_config.NumberColumn("Line", format="%d", width="small"),
+    "Secret Preview": st.column_config.TextColumn(
+        "Secret Preview",
+        help="First 40 characters of detected secret",
+        width="large"
+    ),
+    "Entropy": st.column_config.NumberColumn(
+        "Entropy",
+        help="Shannon entropy value",
+        format="%.2f"
+    )
+}
 
 # Page configuration
 st.set_page_config(
@@ -32,16 +66,66 @@ def init_session_state():
     """Initialize session state variables."""
     if 'scan_results' not in st.session_state:
         st.session_state.scan_results = None
+    if 'scan_key' not in st.session_state:
+        st.session_state.scan_key = None
     if 'config' not in st.session_state:
         st.session_state.config = None
     if 'github_token' not in st.session_state:
         st.session_state.github_token = None
 
 
+def set_scan_results(findings: List[Finding]):
+    """Store scan results under a fresh key for the cached derivations below."""
+    st.session_state.scan_results = findings
+    # Cached data is shared by all sessions, so the key must be unique across
+    # them rather than a per-session counter; every new key adds entries,
+    # which is why the cached derivations cap max_entries
+    st.session_state.scan_key = uuid.uuid4().hex
+
+
+def token_key(github_token: str) -> str:
+    """Digest identifying a token in cache keys, so the token itself is not stored."""
+    return hashlib.sha256(github_token.encode('utf-8')).hexdigest()
+
+
+def get_github_scanner(github_token: str) -> GitHubScanner:
+    """Return the shared GitHubScanner for a token, creating it on first use."""
+    return _github_scanner(token_key(github_token), github_token, st.session_state.config)
+
+
+@st.cache_resource(show_spinner=False, max_entries=32)
+def _github_scanner(key: str, _github_token: str, _config) -> GitHubScanner:
+    # Building a scanner authenticates against the API; reruns and every
+    # scan button reuse it instead. Failures raise and are not cached
+    return GitHubScanner(_config, _github_token)
+
+
+@st.cache_data(show_spinner=False, ttl=60)
+def github_user(key: str, _gh_scanner: GitHubScanner) -> Tuple[str, Optional[str]]:
+    """Login and display name of the token's user, refreshed every minute."""
+    user = _gh_scanner.github.get_user()
+    return user.login, user.name
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_default_rules(mtime: Optional[float]) -> Config:
+    # One parsed (and lazily compiled) Config shared by every session until
+    # the rules file changes; the mtime argument is only the cache key
+    return load_rules()
+
+
+def default_rules_mtime() -> Optional[float]:
+    """Modification time of the bundled rules file, or None if it has no path."""
+    try:
+        return os.path.getmtime(resources.files('secret_scanner').joinpath(DEFAULT_RULES))
+    except (OSError, TypeError):
+        return None
+
+
 def load_default_config():
     """Load default configuration."""
     try:
-        config = load_rules()
+        config = _load_default_rules(default_rules_mtime())
         st.session_state.config = config
         return config
     except Exception as e:
@@ -49,6 +133,12 @@ def load_default_config():
         return None
 
 
+@st.cache_data(show_spinner=False)
+def rule_tag_counts(rules: List[Dict]) -> List[Tuple[str, int]]:
+    """Count rules per tag, sorted by tag; untagged rules count as 'other'."""
+    return sorted(Counter(tag for rule in rules for tag in rule.get('tags', ['other'])).items())
+
+
 def render_sidebar():
     """Render sidebar with configuration options."""
     st.sidebar.title("Configuration")
@@ -64,15 +154,7 @@ def render_sidebar():
         
         # Show rule categories
         with st.sidebar.expander("Detection Rules", expanded=False):
-            rule_tags = {}
-            for rule in config.rules:
-                tags = rule.get('tags', ['other'])
-                for tag in tags:
-                    if tag not in rule_tags:
-                        rule_tags[tag] = 0
-                    rule_tags[tag] += 1
-            
-            for tag, count in sorted(rule_tags.items()):
+            for tag, count in rule_tag_counts(config.rules):
                 st.write(f"• {tag}: {count} rules")
         
         # Configuration warnings
@@ -137,6 +219,202 @@ def scan_path(path: str, git_history: bool = False, max_commits: int = None) ->
         return []
 
 
+# Derivations of a result set, cached across reruns. Streamlit reruns the whole
+# script on every widget interaction; scan_key identifies the result set, and
+# the underscore-prefixed findings argument is not hashed.
+
+class FindingsSummary(NamedTuple):
+    """Aggregate figures for a set of findings."""
+    
+    unique_files: int
+    unique_rules: int
+    entropy_count: int
+    avg_entropy: Optional[float]
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def summarize_findings(scan_key: str, _findings: List[Finding]) -> FindingsSummary:
+    """Count affected files and rule types, and average the entropy of findings, in one pass."""
+    files = set()
+    rules = set()
+    entropy_total = 0.0
+    entropy_count = 0
+    
+    for finding in _findings:
+        files.add(finding.file_path)
+        rules.add(finding.rule_id)
+        if finding.entropy:
+            entropy_total += finding.entropy
+            entropy_count += 1
+    
+    return FindingsSummary(
+        unique_files=len(files),
+        unique_rules=len(rules),
+        entropy_count=entropy_count,
+        avg_entropy=entropy_total / entropy_count if entropy_count else None
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def count_by_rule(scan_key: str, _findings: List[Finding]) -> Dict[str, int]:
+    """Count findings per rule ID."""
+    return dict(Counter(f.rule_id for f in _findings))
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def count_by_file(scan_key: str, _findings: List[Finding]) -> List[Tuple[str, int]]:
+    """Return the 10 file names with the most findings, most first."""
+    # Truncate long file paths
+    return Counter(os.path.basename(f.file_path) for f in _findings).most_common(10)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def findings_to_frame(scan_key: str, _findings: List[Finding], show_entropy: bool = True) -> pd.DataFrame:
+    """Build the findings table, deriving display columns column-wise."""
+    df = pd.DataFrame.from_records(
+        [
+            (f.rule_id, f.description, f.file_path, f.line_number, f.secret, f.entropy, f.commit_hash)
+            for f in _findings
+        ],
+        columns=["Rule ID", "Description", "Full Path", "Line", "Secret", "Entropy", "Commit"]
+    )
+    
+    df.insert(0, "#", np.arange(1, len(df) + 1))
+    df.insert(3, "File", df["Full Path"].map(os.path.basename))
+    # Few distinct rules and files across many findings: categories make
+    # the filter options and isin masks work on small integer codes
+    df["Rule ID"] = df["Rule ID"].astype("category")
+    df["File"] = df["File"].astype("category")
+    # Nullable integers keep the column numeric (and Arrow-friendly) where
+    # a line number is missing
+    df["Line"] = df["Line"].astype("Int32")
+    
+    secret = df.pop("Secret")
+    preview = secret.str.slice(0, 40)
+    df.insert(6, "Secret Preview", preview.where(secret.str.len() <= 40, preview + "..."))
+    
+    entropy = df.pop("Entropy").astype(float)
+    if show_entropy:
+        df.insert(7, "Entropy", entropy.where(entropy > 0).round(2))
+    df["Commit"] = df["Commit"].str.slice(0, 8)
+    
+    # Optional columns are only shown when some finding has a value
+    empty = [column for column in ("Entropy", "Commit") if column in df and df[column].isna().all()]
+    return df.drop(columns=empty)
+
+
+# Export downloads must be ready when the buttons render, so each is built
+# once per result set (and filter selection, for CSV) instead of every rerun
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def findings_to_json(scan_key: str, _findings: List[Finding]) -> bytes:
+    """Serialize findings for the JSON download, with orjson when installed."""
+    report = {
+        "total_findings": len(_findings),
+        "findings": [f.to_dict() for f in _findings]
+    }
+    if orjson is not None:
+        return orjson.dumps(report, option=orjson.OPT_INDENT_2)
+    return json.dumps(report, indent=2).encode('utf-8')
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def frame_to_csv(
+    scan_key: str,
+    show_entropy: bool,
+    rule_filter: Tuple[str, ...],
+    file_filter: Tuple[str, ...],
+    _filtered_df: pd.DataFrame
+) -> str:
+    """Serialize the filtered findings table for the CSV download."""
+    return _filtered_df.to_csv(index=False)
+
+
+@st.cache_data(show_spinner=False, max_entries=64)
+def findings_to_markdown(scan_key: str, _findings: List[Finding]) -> str:
+    """Render findings as the Markdown report download."""
+    summary = summarize_findings(scan_key, _findings)
+    parts = [
+        "# Secret Scanner Report",
+        "",
+        "## Summary",
+        f"- Total Findings: {len(_findings)}",
+        f"- Unique Files: {summary.unique_files}",
+        f"- Rule Types: {summary.unique_rules}",
+        "",
+        "## Findings",
+    ]
+    
+    # Collected and joined once; += on the report string copies it each time
+    for i, finding in enumerate(_findings, 1):
+        parts.append("")
+        parts.append(f"### Finding {i}: {finding.rule_id}")
+        parts.append(f"- **Description**: {finding.description}")
+        parts.append(f"- **File**: {finding.file_path}")
+        parts.append(f"- **Line**: {finding.line_number or 'N/A'}")
+        if finding.entropy:
+            parts.append(f"- **Entropy**: {finding.entropy:.2f}")
+        parts.append(f"- **Secret Preview**: {finding.secret[:60]}...")
+    
+    parts.append("")
+    return "\n".join(parts)
+
+
+# Figures are built once per distinct data and reused by every rerun; with a
+# stable element key the front end updates the chart in place
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def rule_chart(rule_counts: Tuple[Tuple[str, int], ...]) -> go.Figure:
+    """Bar chart of findings per rule type."""
+    fig = px.bar(
+        x=[rule for rule, _ in rule_counts],
+        y=[count for _, count in rule_counts],
+        labels={'x': 'Rule Type', 'y': 'Count'},
+        title='Findings by Rule Type',
+        color=[count for _, count in rule_counts],
+        color_continuous_scale='Reds'
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def file_chart(file_counts: Tuple[Tuple[str, int], ...]) -> go.Figure:
+    """Horizontal bar chart of the files with the most findings."""
+    fig = px.bar(
+        x=[f[1] for f in file_counts],
+        y=[f[0] for f in file_counts],
+        orientation='h',
+        labels={'x': 'Count', 'y': 'File'},
+        title='Top 10 Files with Findings',
+        color=[f[1] for f in file_counts],
+        color_continuous_scale='Oranges'
+    )
+    fig.update_layout(showlegend=False, yaxis={'categoryorder': 'total ascending'})
+    return fig
+
+
+@st.cache_resource(show_spinner=False, max_entries=64)
+def entropy_chart(scan_key: str, _findings: List[Finding]) -> go.Figure:
+    """Histogram of finding entropy; only for findings that have one."""
+    entropy_values = [f.entropy for f in _findings if f.entropy]
+    
+    # Bin here and send the browser 20 bars rather than every value
+    counts, edges = np.histogram(entropy_values, bins=20)
+    fig = go.Figure(go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        width=np.diff(edges),
+        marker_color='#FF6B6B'
+    ))
+    fig.update_layout(
+        title='Entropy Distribution',
+        xaxis_title='Entropy Value',
+        yaxis_title='Count'
+    )
+    return fig
+
+
 def render_findings_summary(findings: List[Finding]):
     """Render summary statistics of findings."""
     if not findings:
@@ -145,6 +423,8 @@ def render_findings_summary(findings: List[Finding]):
     
     st.error(f"WARNING: {len(findings)} secret(s) detected!")
     
+    summary = summarize_findings(st.session_state.scan_key, findings)
+    
     # Summary metrics
     col1, col2, col3, col4 = st.columns(4)
     
@@ -152,16 +432,13 @@ def render_findings_summary(findings: List[Finding]):
         st.metric("Total Findings", len(findings))
     
     with col2:
-        unique_files = len(set(f.file_path for f in findings))
-        st.metric("Affected Files", unique_files)
+        st.metric("Affected Files", summary.unique_files)
     
     with col3:
-        unique_rules = len(set(f.rule_id for f in findings))
-        st.metric("Rule Types", unique_rules)
+        st.metric("Rule Types", summary.unique_rules)
     
     with col4:
-        avg_entropy = sum(f.entropy for f in findings if f.entropy) / len([f for f in findings if f.entropy])
-        st.metric("Avg Entropy", f"{avg_entropy:.2f}" if avg_entropy else "N/A")
+        st.metric("Avg Entropy", f"{summary.avg_entropy:.2f}" if summary.avg_entropy else "N/A")
 
 
 def render_findings_charts(findings: List[Finding]):
@@ -169,59 +446,27 @@ def render_findings_charts(findings: List[Finding]):
     if not findings:
         return
     
+    scan_key = st.session_state.scan_key
     col1, col2 = st.columns(2)
     
     # Findings by rule type
     with col1:
-        rule_counts = {}
-        for finding in findings:
-            rule_counts[finding.rule_id] = rule_counts.get(finding.rule_id, 0) + 1
-        
-        fig = px.bar(
-            x=list(rule_counts.keys()),
-            y=list(rule_counts.values()),
-            labels={'x': 'Rule Type', 'y': 'Count'},
-            title='Findings by Rule Type',
-            color=list(rule_counts.values()),
-            color_continuous_scale='Reds'
-        )
-        fig.update_layout(showlegend=False)
-        st.plotly_chart(fig, use_container_width=True)
+        rule_counts = count_by_rule(scan_key, findings)
+        fig = rule_chart(tuple(rule_counts.items()))
+        st.plotly_chart(fig, use_container_width=True, key="rule_chart")
     
     # Findings by file
     with col2:
-        file_counts = {}
-        for finding in findings:
-            # Truncate long file paths
-            file_name = Path(finding.file_path).name
-            file_counts[file_name] = file_counts.get(file_name, 0) + 1
-        
         # Show top 10 files
-        sorted_files = sorted(file_counts.items(), key=lambda x: x[1], reverse=True)[:10]
-        
-        fig = px.bar(
-            x=[f[1] for f in sorted_files],
-            y=[f[0] for f in sorted_files],
-            orientation='h',
-            labels={'x': 'Count', 'y': 'File'},
-            title='Top 10 Files with Findings',
-            color=[f[1] for f in sorted_files],
-            color_continuous_scale='Oranges'
-        )
-        fig.update_layout(showlegend=False, yaxis={'categoryorder': 'total ascending'})
-        st.plotly_chart(fig, use_container_width=True)
-    
-    # Entropy distribution (if available)
-    entropy_values = [f.entropy for f in findings if f.entropy is not None]
-    if entropy_values:
-        fig = px.histogram(
-            x=entropy_values,
-            nbins=20,
-            labels={'x': 'Entropy Value', 'y': 'Count'},
-            title='Entropy Distribution',
-            color_discrete_sequence=['#FF6B6B']
-        )
-        st.plotly_chart(fig, use_container_width=True)
+        sorted_files = count_by_file(scan_key, findings)
+        fig = file_chart(tuple(sorted_files))
+        st.plotly_chart(fig, use_container_width=True, key="file_chart")
+    
+    # Entropy distribution (if available); the cached summary already
+    # counted entropy values, so scans without any skip the chart outright
+    if summarize_findings(scan_key, findings).entropy_count:
+        fig = entropy_chart(scan_key, findings)
+        st.plotly_chart(fig, use_container_width=True, key="entropy_chart")
 
 
 def render_findings_table(findings: List[Finding], show_entropy: bool = True):
@@ -232,27 +477,8 @@ def render_findings_table(findings: List[Finding], show_entropy: bool = True):
     st.subheader("Detailed Findings")
     
     # Convert findings to DataFrame
-    data = []
-    for i, finding in enumerate(findings, 1):
-        row = {
-            "#": i,
-            "Rule ID": finding.rule_id,
-            "Description": finding.description,
-            "File": Path(finding.file_path).name,
-            "Full Path": finding.file_path,
-            "Line": finding.line_number or "N/A",
-            "Secret Preview": finding.secret[:40] + "..." if len(finding.secret) > 40 else finding.secret,
-        }
-        
-        if show_entropy and finding.entropy:
-            row["Entropy"] = f"{finding.entropy:.2f}"
-        
-        if finding.commit_hash:
-            row["Commit"] = finding.commit_hash[:8]
-        
-        data.append(row)
-    
-    df = pd.DataFrame(data)
+    scan_key = st.session_state.scan_key
+    df = findings_to_frame(scan_key, findings, show_entropy)
     
     # Add filters
     col1, col2 = st.columns(2)
@@ -260,41 +486,45 @@ def render_findings_table(findings: List[Finding], show_entropy: bool = True):
     with col1:
         rule_filter = st.multiselect(
             "Filter by Rule Type",
-            options=sorted(df["Rule ID"].unique()),
+            options=df["Rule ID"].cat.categories.tolist(),
             default=[]
         )
     
     with col2:
         file_filter = st.multiselect(
             "Filter by File",
-            options=sorted(df["File"].unique()),
+            options=df["File"].cat.categories.tolist(),
             default=[]
         )
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters as one mask; with none selected the table is used as is
+    mask = np.ones(len(df), dtype=bool)
     if rule_filter:
-        filtered_df = filtered_df[filtered_df["Rule ID"].isin(rule_filter)]
+        mask &= df["Rule ID"].isin(rule_filter).to_numpy()
     if file_filter:
-        filtered_df = filtered_df[filtered_df["File"].isin(file_filter)]
+        mask &= df["File"].isin(file_filter).to_numpy()
+    filtered_df = df if mask.all() else df.loc[mask]
+    
+    # Display table one page at a time; the whole table is serialized to
+    # the browser on every rerun otherwise
+    page_df = filtered_df
+    if len(filtered_df) > TABLE_PAGE_SIZE:
+        pages = -(-len(filtered_df) // TABLE_PAGE_SIZE)
+        page = st.number_input(
+            f"Page (of {pages})",
+            min_value=1,
+            max_value=pages,
+            value=1,
+            help=f"{len(filtered_df)} findings, {TABLE_PAGE_SIZE} per page"
+        )
+        start = (page - 1) * TABLE_PAGE_SIZE
+        page_df = filtered_df.iloc[start:start + TABLE_PAGE_SIZE]
     
-    # Display table
     st.dataframe(
-        filtered_df,
+        page_df,
         use_container_width=True,
         hide_index=True,
-        column_config={
-            "Secret Preview": st.column_config.TextColumn(
-                "Secret Preview",
-                help="First 40 characters of detected secret",
-                width="large"
-            ),
-            "Entropy": st.column_config.NumberColumn(
-                "Entropy",
-                help="Shannon entropy value",
-                format="%.2f"
-            )
-        }
+        column_config=FINDINGS_COLUMN_CONFIG
     )
     
     # Export options
@@ -304,552 +534,508 @@ def render_findings_table(findings: List[Finding], show_entropy: bool = True):
     
     with col1:
         # Export as JSON
-        json_data = json.dumps(
-            {
-                "total_findings": len(findings),
-                "findings": [f.to_dict() for f in findings]
-            },
-            indent=2
-        )
         st.download_button(
             label="📥 Download JSON",
-            data=json_data,
+            data=findings_to_json(scan_key, findings),
             file_name="scan_results.json",
             mime="application/json"
         )
     
     with col2:
         # Export as CSV
-        csv_data = filtered_df.to_csv(index=False)
         st.download_button(
             label="📥 Download CSV",
-            data=csv_data,
+            data=frame_to_csv(scan_key, show_entropy, tuple(rule_filter), tuple(file_filter), filtered_df),
             file_name="scan_results.csv",
             mime="text/csv"
         )
     
     with col3:
         # Export full report
-        report = f"""# Secret Scanner Report
-
-## Summary
-- Total Findings: {len(findings)}
-- Unique Files: {len(set(f.file_path for f in findings))}
-- Rule Types: {len(set(f.rule_id for f in findings))}
-
-## Findings
-"""
-        for i, finding in enumerate(findings, 1):
-            report += f"\n### Finding {i}: {finding.rule_id}\n"
-            report += f"- **Description**: {finding.description}\n"
-            report += f"- **File**: {finding.file_path}\n"
-            report += f"- **Line**: {finding.line_number or 'N/A'}\n"
-            if finding.entropy:
-                report += f"- **Entropy**: {finding.entropy:.2f}\n"
-            report += f"- **Secret Preview**: {finding.secret[:60]}...\n"
-        
         st.download_button(
             label="📥 Download Report (MD)",
-            data=report,
+            data=findings_to_markdown(scan_key, findings),
             file_name="scan_report.md",
             mime="text/markdown"
         )
 
 
-def main():
-    """Main UI function."""
-    init_session_state()
+@st.fragment
+def render_local_tab(scan_mode: str, max_commits: int):
+    """Render the local files and upload scan tab."""
+    st.header("Scan Local Files")
     
-    # Header with logo
-    logo_path = Path(__file__).parent.parent.parent / "media" / "gitfih.png"
-    if logo_path.exists():
-        col1, col2 = st.columns([1, 4])
-        with col1:
-            st.image(str(logo_path), width=150)
-        with col2:
-            st.title("Secret Scanner")
-            st.markdown("**Production-grade secret detection for Git repositories and files**")
-    else:
-        st.title("Secret Scanner")
-        st.markdown("**Production-grade secret detection for Git repositories and files**")
-    
-    # Sidebar
-    scan_mode, max_commits, show_entropy = render_sidebar()
-    tab1, tab2, tab3, tab4 = st.tabs(["Scan Local", "Scan GitHub", "Results", "About"])
+    # Input method
+    input_method = st.radio(
+        "Input Method",
+        ["Local Path", "Upload Files"],
+        horizontal=True
+    )
     
-    with tab1:
-        st.header("Scan Local Files")
-        
-        # Input method
-        input_method = st.radio(
-            "Input Method",
-            ["Local Path", "Upload Files"],
-            horizontal=True
+    if input_method == "Local Path":
+        path = st.text_input(
+            "Enter path to scan",
+            value=os.getcwd(),
+            help="Absolute or relative path to file or directory"
         )
         
-        if input_method == "Local Path":
-            path = st.text_input(
-                "Enter path to scan",
-                value=os.getcwd(),
-                help="Absolute or relative path to file or directory"
-            )
-            
-            if st.button("🚀 Start Scan", type="primary", use_container_width=True, key="local_scan"):
-                if path:
-                    findings = scan_path(
-                        path,
-                        git_history=(scan_mode == "Git History"),
-                        max_commits=max_commits
-                    )
-                    st.session_state.scan_results = findings
-                    st.rerun()
-                else:
-                    st.error("Please enter a path")
+        if st.button("🚀 Start Scan", type="primary", use_container_width=True, key="local_scan"):
+            if path:
+                findings = scan_path(
+                    path,
+                    git_history=(scan_mode == "Git History"),
+                    max_commits=max_commits
+                )
+                set_scan_results(findings)
+                st.rerun()
+            else:
+                st.error("Please enter a path")
+    
+    else:  # Upload Files
+        uploaded_files = st.file_uploader(
+            "Upload files to scan",
+            accept_multiple_files=True,
+            help="Upload source code files to scan for secrets"
+        )
         
-        else:  # Upload Files
-            uploaded_files = st.file_uploader(
-                "Upload files to scan",
-                accept_multiple_files=True,
-                help="Upload source code files to scan for secrets"
-            )
-            
-            if uploaded_files and st.button("🚀 Start Scan", type="primary", use_container_width=True, key="upload_scan"):
-                # Create temp directory
-                with tempfile.TemporaryDirectory() as temp_dir:
-                    temp_path = Path(temp_dir)
-                    
-                    # Save uploaded files
-                    for uploaded_file in uploaded_files:
-                        file_path = temp_path / uploaded_file.name
-                        file_path.write_bytes(uploaded_file.getvalue())
-                    
-                    # Scan temp directory
-                    findings = scan_path(str(temp_path))
-                    st.session_state.scan_results = findings
-                    st.rerun()
+        if uploaded_files and st.button("🚀 Start Scan", type="primary", use_container_width=True, key="upload_scan"):
+            # Create temp directory
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_path = Path(temp_dir)
+                
+                # Save uploaded files, copying in chunks rather than
+                # duplicating each upload in memory with getvalue()
+                for uploaded_file in uploaded_files:
+                    uploaded_file.seek(0)
+                    with open(temp_path / uploaded_file.name, 'wb') as out:
+                        shutil.copyfileobj(uploaded_file, out, UPLOAD_CHUNK_SIZE)
+                
+                # Scan temp directory
+                findings = scan_path(str(temp_path))
+                set_scan_results(findings)
+                st.rerun()
+
+
+def render_github_tab(max_commits: int):
+    """Render the GitHub scan tab."""
+    st.header("Scan GitHub Repositories")
     
-    with tab2:
-        st.header("Scan GitHub Repositories")
+    # GitHub authentication (required)
+    with st.expander("🔐 GitHub Authentication (Required)", expanded=True):
+        st.markdown("""
+        **Required:** Authenticate with your GitHub Personal Access Token to scan public repositories.
         
-        # GitHub authentication (required)
-        with st.expander("🔐 GitHub Authentication (Required)", expanded=True):
-            st.markdown("""
-            **Required:** Authenticate with your GitHub Personal Access Token to scan public repositories.
-            
-            **How to create a PAT:**
-            1. Go to [GitHub Settings > Tokens](https://github.com/settings/tokens)
-            2. Click "Generate new token (classic)"
-            3. Give it a name (e.g., "Secret Scanner")
-            4. Select scope: **`public_repo`** (read-only access to public repositories)
-            5. Click "Generate token" and copy it
-            """)
-            
-            github_token = st.text_input(
-                "GitHub Personal Access Token (PAT)",
-                type="password",
-                placeholder="ghp_xxxxxxxxxxxxxxxxxxxx",
-                value=st.session_state.get('github_token', ''),
-                help="Your GitHub PAT with 'public_repo' scope"
-            )
-            
-            # Store token in session state
-            if github_token:
-                st.session_state.github_token = github_token
-            
-            # Validate and show authenticated user info
-            if github_token:
-                try:
-                    gh_scanner = GitHubScanner(st.session_state.config, github_token)
-                    auth_user = gh_scanner.github.get_user()
-                    st.success(f"Authenticated as: **{auth_user.login}** ({auth_user.name or 'No name'})")
-                    
-                    # Show rate limit
-                    rate_limit = gh_scanner.get_rate_limit()
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.metric("API Requests Remaining", rate_limit['core']['remaining'])
-                    with col2:
-                        st.metric("Search Requests Remaining", rate_limit['search']['remaining'])
-                except Exception as e:
-                    st.error(f"Authentication failed: {e}")
-                    st.info("Please verify your token is valid and has the correct scopes.")
-            else:
-                st.warning("Please enter your Personal Access Token to proceed.")
+        **How to create a PAT:**
+        1. Go to [GitHub Settings > Tokens](https://github.com/settings/tokens)
+        2. Click "Generate new token (classic)"
+        3. Give it a name (e.g., "Secret Scanner")
+        4. Select scope: **`public_repo`** (read-only access to public repositories)
+        5. Click "Generate token" and copy it
+        """)
         
-        # Scan mode
-        github_scan_mode = st.radio(
-            "Scan Mode",
-            ["Single Repository", "User Repositories", "Organization Repositories", "Search Repositories"],
-            horizontal=False
+        github_token = st.text_input(
+            "GitHub Personal Access Token (PAT)",
+            type="password",
+            placeholder="ghp_xxxxxxxxxxxxxxxxxxxx",
+            value=st.session_state.get('github_token', ''),
+            help="Your GitHub PAT with 'public_repo' scope"
         )
         
-        if github_scan_mode == "Single Repository":
-            repo_input = st.text_input(
-                "Repository URL or owner/repo",
-                placeholder="https://github.com/owner/repo or owner/repo",
-                help="Enter GitHub repository URL or owner/repo format"
-            )
-            
-            scan_git_history = st.checkbox(
-                "Scan Git History",
-                value=False,
-                help="Scan commit history for secrets (slower)"
-            )
-            
-            if st.button("Scan Repository", type="primary", use_container_width=True):
-                if not github_token:
-                    st.error("Please authenticate with your GitHub token first (see settings above)")
-                elif repo_input:
-                    try:
-                        gh_scanner = GitHubScanner(st.session_state.config, github_token)
-                        with st.spinner(f"Scanning repository..."):
-                            result = gh_scanner.scan_repository(
-                                repo_input,
-                                scan_history=scan_git_history,
-                                max_commits=max_commits
-                            )
-                        
-                        st.success(f"Scanned {result['repo_name']}")
-                        st.session_state.scan_results = result['findings']
-                        
-                        # Show repo info
-                        col1, col2, col3 = st.columns(3)
-                        with col1:
-                            st.metric("Stars", result['stars'])
-                        with col2:
-                            st.metric("Language", result['language'] or "N/A")
-                        with col3:
-                            st.metric("Findings", result['total_findings'])
-                        
-                        st.rerun()
-                    except Exception as e:
-                        st.error(f"Error: {e}")
-                else:
-                    st.error("Please enter a repository URL or owner/repo")
+        # Store token in session state
+        if github_token:
+            st.session_state.github_token = github_token
         
-        elif github_scan_mode == "User Repositories":
-            st.info("💡 Scan public repositories from any GitHub user (including yourself)")
-            
-            # Option to quickly use authenticated user
-            if github_token:
+        # Validate and show authenticated user info
+        if github_token:
+            try:
+                gh_scanner = get_github_scanner(github_token)
+                login, name = github_user(token_key(github_token), gh_scanner)
+                st.success(f"Authenticated as: **{login}** ({name or 'No name'})")
+                
+                # Show rate limit
+                rate_limit = gh_scanner.get_rate_limit()
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("API Requests Remaining", rate_limit['core']['remaining'])
+                with col2:
+                    st.metric("Search Requests Remaining", rate_limit['search']['remaining'])
+            except Exception as e:
+                st.error(f"Authentication failed: {e}")
+                st.info("Please verify your token is valid and has the correct scopes.")
+        else:
+            st.warning("Please enter your Personal Access Token to proceed.")
+    
+    # Scan mode
+    github_scan_mode = st.radio(
+        "Scan Mode",
+        ["Single Repository", "User Repositories", "Organization Repositories", "Search Repositories"],
+        horizontal=False
+    )
+    
+    if github_scan_mode == "Single Repository":
+        repo_input = st.text_input(
+            "Repository URL or owner/repo",
+            placeholder="https://github.com/owner/repo or owner/repo",
+            help="Enter GitHub repository URL or owner/repo format"
+        )
+        
+        scan_git_history = st.checkbox(
+            "Scan Git History",
+            value=False,
+            help="Scan commit history for secrets (slower)"
+        )
+        
+        if st.button("Scan Repository", type="primary", use_container_width=True):
+            if not github_token:
+                st.error("Please authenticate with your GitHub token first (see settings above)")
+            elif repo_input:
                 try:
-                    gh_scanner = GitHubScanner(st.session_state.config, github_token)
-                    auth_username = gh_scanner.authenticated_user
+                    gh_scanner = get_github_scanner(github_token)
+                    with st.spinner(f"Scanning repository..."):
+                        result = gh_scanner.scan_repository(
+                            repo_input,
+                            scan_history=scan_git_history,
+                            max_commits=max_commits
+                        )
+                    
+                    st.success(f"Scanned {result['repo_name']}")
+                    set_scan_results(result['findings'])
                     
-                    col1, col2 = st.columns([3, 1])
+                    # Show repo info
+                    col1, col2, col3 = st.columns(3)
                     with col1:
-                        username = st.text_input(
-                            "GitHub Username",
-                            placeholder="octocat",
-                            help="Enter any GitHub username to scan their public repositories",
-                            value=""
-                        )
+                        st.metric("Stars", result['stars'])
                     with col2:
-                        st.write("")  # Spacing
-                        st.write("")  # Spacing
-                        if st.button("Use My Account", help=f"Scan {auth_username}'s repos"):
-                            username = auth_username
-                            st.session_state.scan_username = auth_username
+                        st.metric("Language", result['language'] or "N/A")
+                    with col3:
+                        st.metric("Findings", result['total_findings'])
                     
-                    # Use session state value if set
-                    if 'scan_username' in st.session_state and st.session_state.scan_username:
-                        username = st.session_state.scan_username
-                        st.caption(f"Scanning: **{username}**")
-                except:
+                    st.rerun()
+                except Exception as e:
+                    st.error(f"Error: {e}")
+            else:
+                st.error("Please enter a repository URL or owner/repo")
+    
+    elif github_scan_mode == "User Repositories":
+        st.info("💡 Scan public repositories from any GitHub user (including yourself)")
+        
+        # Option to quickly use authenticated user
+        if github_token:
+            try:
+                gh_scanner = get_github_scanner(github_token)
+                auth_username = gh_scanner.authenticated_user
+                
+                col1, col2 = st.columns([3, 1])
+                with col1:
                     username = st.text_input(
                         "GitHub Username",
                         placeholder="octocat",
-                        help="Enter GitHub username to scan their public repositories"
+                        help="Enter any GitHub username to scan their public repositories",
+                        value=""
                     )
-            else:
+                with col2:
+                    st.write("")  # Spacing
+                    st.write("")  # Spacing
+                    if st.button("Use My Account", help=f"Scan {auth_username}'s repos"):
+                        username = auth_username
+                        st.session_state.scan_username = auth_username
+                
+                # Use session state value if set
+                if 'scan_username' in st.session_state and st.session_state.scan_username:
+                    username = st.session_state.scan_username
+                    st.caption(f"Scanning: **{username}**")
+            except:
                 username = st.text_input(
                     "GitHub Username",
                     placeholder="octocat",
                     help="Enter GitHub username to scan their public repositories"
                 )
-            
-            max_repos = st.slider(
-                "Maximum Repositories to Scan",
-                min_value=1,
-                max_value=20,
-                value=5,
-                help="Limit number of repositories to scan"
-            )
-            
-            if st.button("Scan User Repos", type="primary", use_container_width=True):
-                if not github_token:
-                    st.error("Please authenticate with your GitHub token first (see settings above)")
-                elif username:
-                    try:
-                        gh_scanner = GitHubScanner(st.session_state.config, github_token)
-                        with st.spinner(f"Scanning repositories for {username}..."):
-                            results = gh_scanner.scan_user_repositories(
-                                username,
-                                max_repos=max_repos,
-                                scan_history=False
-                            )
-                        
-                        # Store both individual results and aggregated findings
-                        all_findings = []
-                        for result in results:
-                            all_findings.extend(result['findings'])
-                        
-                        st.session_state.scan_results = all_findings
-                        st.session_state.repo_results = results  # Store individual repo results
-                        
-                        st.success(f"Scanned {len(results)} repositories")
-                        
-                        # Show individual repository results
-                        st.subheader("Repository Scan Results")
-                        total_secrets = 0
-                        for idx, result in enumerate(results, 1):
-                            with st.expander(f"{idx}. {result['repo_name']} - {result['total_findings']} findings", expanded=result['total_findings'] > 0):
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    st.metric("Stars", result['stars'])
-                                with col2:
-                                    st.metric("Language", result['language'] or "N/A")
-                                with col3:
-                                    st.metric("Findings", result['total_findings'])
-                                
-                                if result['findings']:
-                                    st.warning(f"Found {result['total_findings']} potential secrets in this repository")
-                                    for finding in result['findings'][:5]:  # Show first 5
-                                        st.code(f"{finding.file}:{finding.line} - {finding.rule_id}", language="text")
-                                    if len(result['findings']) > 5:
-                                        st.caption(f"... and {len(result['findings']) - 5} more findings")
-                                else:
-                                    st.success("No secrets detected")
-                            total_secrets += result['total_findings']
-                        
-                        st.divider()
-                        st.metric("Total Secrets Found Across All Repos", total_secrets)
-                        
-                    except Exception as e:
-                        st.error(f"Error: {e}")
-                else:
-                    st.error("Please enter a GitHub username or click 'Use My Account' button above")
-        
-        elif github_scan_mode == "Organization Repositories":
-            org_name = st.text_input(
-                "Organization Name",
-                placeholder="github",
-                help="Enter GitHub organization name"
-            )
-            
-            max_repos = st.slider(
-                "Maximum Repositories to Scan",
-                min_value=1,
-                max_value=20,
-                value=5,
-                help="Limit number of repositories to scan",
-                key="org_max_repos"
+        else:
+            username = st.text_input(
+                "GitHub Username",
+                placeholder="octocat",
+                help="Enter GitHub username to scan their public repositories"
             )
-            
-            if st.button("Scan Org Repos", type="primary", use_container_width=True):
-                if not github_token:
-                    st.error("Please authenticate with your GitHub token first (see settings above)")
-                elif org_name:
-                    try:
-                        gh_scanner = GitHubScanner(st.session_state.config, github_token)
-                        with st.spinner(f"Scanning repositories for {org_name}..."):
-                            results = gh_scanner.scan_organization_repositories(
-                                org_name,
-                                max_repos=max_repos,
-                                scan_history=False
-                            )
-                        
-                        # Store both individual results and aggregated findings
-                        all_findings = []
-                        for result in results:
-                            all_findings.extend(result['findings'])
-                        
-                        st.session_state.scan_results = all_findings
-                        st.session_state.repo_results = results  # Store individual repo results
-                        
-                        st.success(f"Scanned {len(results)} repositories")
-                        
-                        # Show individual repository results
-                        st.subheader("Repository Scan Results")
-                        total_secrets = 0
-                        for idx, result in enumerate(results, 1):
-                            with st.expander(f"{idx}. {result['repo_name']} - {result['total_findings']} findings", expanded=result['total_findings'] > 0):
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    st.metric("Stars", result['stars'])
-                                with col2:
-                                    st.metric("Language", result['language'] or "N/A")
-                                with col3:
-                                    st.metric("Findings", result['total_findings'])
-                                
-                                if result['findings']:
-                                    st.warning(f"Found {result['total_findings']} potential secrets in this repository")
-                                    for finding in result['findings'][:5]:  # Show first 5
-                                        st.code(f"{finding.file}:{finding.line} - {finding.rule_id}", language="text")
-                                    if len(result['findings']) > 5:
-                                        st.caption(f"... and {len(result['findings']) - 5} more findings")
-                                else:
-                                    st.success("No secrets detected")
-                            total_secrets += result['total_findings']
-                        
-                        st.divider()
-                        st.metric("Total Secrets Found Across All Repos", total_secrets)
-                        
-                    except Exception as e:
-                        st.error(f"Error: {e}")
-                else:
-                    st.error("Please enter an organization name")
         
-        else:  # Search Repositories
-            search_query = st.text_input(
-                "Search Query",
-                placeholder="language:python stars:>100",
-                help="GitHub search query (e.g., 'language:python stars:>100 topic:web')"
-            )
-            
-            max_repos = st.slider(
-                "Maximum Repositories to Scan",
-                min_value=1,
-                max_value=10,
-                value=3,
-                help="Limit number of repositories to scan",
-                key="search_max_repos"
-            )
-            
-            if st.button("Search & Scan", type="primary", use_container_width=True):
-                if not github_token:
-                    st.error("Please authenticate with your GitHub token first (see settings above)")
-                elif search_query:
-                    try:
-                        gh_scanner = GitHubScanner(st.session_state.config, github_token)
-                        with st.spinner(f"Searching and scanning repositories..."):
-                            results = gh_scanner.search_and_scan(
-                                search_query,
-                                max_repos=max_repos,
-                                scan_history=False
-                            )
-                        
-                        # Store both individual results and aggregated findings
-                        all_findings = []
-                        for result in results:
-                            all_findings.extend(result['findings'])
-                        
-                        st.session_state.scan_results = all_findings
-                        st.session_state.repo_results = results  # Store individual repo results
-                        
-                        st.success(f"Scanned {len(results)} repositories")
-                        
-                        # Show individual repository results
-                        st.subheader("Repository Scan Results")
-                        total_secrets = 0
-                        for idx, result in enumerate(results, 1):
-                            with st.expander(f"{idx}. {result['repo_name']} - {result['total_findings']} findings", expanded=result['total_findings'] > 0):
-                                col1, col2, col3 = st.columns(3)
-                                with col1:
-                                    st.metric("Stars", result['stars'])
-                                with col2:
-                                    st.metric("Language", result['language'] or "N/A")
-                                with col3:
-                                    st.metric("Findings", result['total_findings'])
-                                
-                                if result['findings']:
-                                    st.warning(f"Found {result['total_findings']} potential secrets in this repository")
-                                    for finding in result['findings'][:5]:  # Show first 5
-                                        st.code(f"{finding.file}:{finding.line} - {finding.rule_id}", language="text")
-                                    if len(result['findings']) > 5:
-                                        st.caption(f"... and {len(result['findings']) - 5} more findings")
-                                else:
-                                    st.success("No secrets detected")
-                            total_secrets += result['total_findings']
-                        
-                        st.divider()
-                        st.metric("Total Secrets Found Across All Repos", total_secrets)
-                        
-                    except Exception as e:
-                        st.error(f"Error: {e}")
-                else:
-                    st.error("Please enter a search query")
-    
-    with tab3:
-        st.header("Scan Results")
+        max_repos = st.slider(
+            "Maximum Repositories to Scan",
+            min_value=1,
+            max_value=20,
+            value=5,
+            help="Limit number of repositories to scan"
+        )
         
-        if st.session_state.scan_results is not None:
-            findings = st.session_state.scan_results
-            
-            # Summary
-            render_findings_summary(findings)
-            
-            if findings:
-                st.divider()
-                
-                # Charts
-                st.subheader("Visualization")
-                render_findings_charts(findings)
-                
-                st.divider()
+        if st.button("Scan User Repos", type="primary", use_container_width=True):
+            if not github_token:
+                st.error("Please authenticate with your GitHub token first (see settings above)")
+            elif username:
+                try:
+                    gh_scanner = get_github_scanner(github_token)
+                    with st.spinner(f"Scanning repositories for {username}..."):
+                        results = gh_scanner.scan_user_repositories(
+                            username,
+                            max_repos=max_repos,
+                            scan_history=False
+                        )
+                    
+                    render_repo_results(results)
                 
-                # Detailed table
-                render_findings_table(findings, show_entropy)
-        else:
-            st.info("No scan results yet. Go to the 'Scan Local' or 'Scan GitHub' tab to start scanning.")
+                except Exception as e:
+                    st.error(f"Error: {e}")
+            else:
+                st.error("Please enter a GitHub username or click 'Use My Account' button above")
     
-    with tab4:
-        st.header("About Secret Scanner")
-        
-        st.markdown("""
-        ### Features
-        - **30+ Detection Rules** - AWS, GitHub, Stripe, API keys, and more
-        - **Shannon Entropy Analysis** - Detect high-randomness secrets
-        - **Git History Scanning** - Find secrets in commit history
-        - **GitHub Integration** - Scan public repositories directly
-        - **Interactive UI** - Easy-to-use web interface
-        - **Visualizations** - Charts and graphs for analysis
-        - **Export Options** - JSON, CSV, Markdown reports
-        
-        ### Detection Categories
-        - Cloud Credentials (AWS, Google Cloud, Azure)
-        - Version Control Tokens (GitHub, GitLab)
-        - API Keys (Stripe, Slack, SendGrid, Twilio)
-        - Database Connection Strings
-        - Private Keys (RSA, EC, OpenSSH)
-        - JWT Tokens
-        - Generic High-Entropy Strings
-        
-        ### How It Works
-        1. **Pattern Matching**: Regex-based detection for known secret formats
-        2. **Entropy Analysis**: Shannon entropy calculation to find random-looking strings
-        3. **Smart Filtering**: Keyword optimization and path exclusions
-        4. **Reporting**: Detailed findings with line numbers and file paths
+    elif github_scan_mode == "Organization Repositories":
+        org_name = st.text_input(
+            "Organization Name",
+            placeholder="github",
+            help="Enter GitHub organization name"
+        )
         
-        ### Usage Tips
-        - Use **Git History** mode to find secrets introduced in past commits
-        - Enable **Show Entropy Values** to see randomness scores
-        - Filter results by **Rule Type** or **File** for focused analysis
-        - Export results for documentation or compliance reporting
+        max_repos = st.slider(
+            "Maximum Repositories to Scan",
+            min_value=1,
+            max_value=20,
+            value=5,
+            help="Limit number of repositories to scan",
+            key="org_max_repos"
+        )
         
-        ### Version
-        - **Version**: 0.1.0
-        - **License**: MIT
-        - **Python**: 3.10+
+        if st.button("Scan Org Repos", type="primary", use_container_width=True):
+            if not github_token:
+                st.error("Please authenticate with your GitHub token first (see settings above)")
+            elif org_name:
+                try:
+                    gh_scanner = get_github_scanner(github_token)
+                    with st.spinner(f"Scanning repositories for {org_name}..."):
+                        results = gh_scanner.scan_organization_repositories(
+                            org_name,
+                            max_repos=max_repos,
+                            scan_history=False
+                        )
+                    
+                    render_repo_results(results)
+                
+                except Exception as e:
+                    st.error(f"Error: {e}")
+            else:
+                st.error("Please enter an organization name")
+    
+    else:  # Search Repositories
+        search_query = st.text_input(
+            "Search Query",
+            placeholder="language:python stars:>100",
+            help="GitHub search query (e.g., 'language:python stars:>100 topic:web')"
+        )
         
-        ### Resources
-        - [Documentation](README.md)
-        - [GitHub Repository](#)
-        - [Report Issues](#)
-        """)
+        max_repos = st.slider(
+            "Maximum Repositories to Scan",
+            min_value=1,
+            max_value=10,
+            value=3,
+            help="Limit number of repositories to scan",
+            key="search_max_repos"
+        )
         
-        st.divider()
+        if st.button("Search & Scan", type="primary", use_container_width=True):
+            if not github_token:
+                st.error("Please authenticate with your GitHub token first (see settings above)")
+            elif search_query:
+                try:
+                    gh_scanner = get_github_scanner(github_token)
+                    with st.spinner(f"Searching and scanning repositories..."):
+                        results = gh_scanner.search_and_scan(
+                            search_query,
+                            max_repos=max_repos,
+                            scan_history=False
+                        )
+                    
+                    render_repo_results(results)
+                
+                except Exception as e:
+                    st.error(f"Error: {e}")
+            else:
+                st.error("Please enter a search query")
+
+
+def render_repo_results(results: List[Dict]):
+    """Store multi-repository scan results and render them per repository."""
+    # Store both individual results and aggregated findings
+    all_findings = []
+    for result in results:
+        all_findings.extend(result['findings'])
+    
+    set_scan_results(all_findings)
+    st.session_state.repo_results = results  # Store individual repo results
+    
+    st.success(f"Scanned {len(results)} repositories")
+    
+    # Show individual repository results, with their stats in one table
+    # rather than three metrics per repository
+    st.subheader("Repository Scan Results")
+    st.dataframe(
+        pd.DataFrame(
+            [
+                (result['repo_name'], result['stars'], result['language'] or "N/A", result['total_findings'])
+                for result in results
+            ],
+            columns=["Repository", "Stars", "Language", "Findings"]
+        ),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    total_secrets = 0
+    for idx, result in enumerate(results, 1):
+        with st.expander(f"{idx}. {result['repo_name']} - {result['total_findings']} findings", expanded=result['total_findings'] > 0):
+            if result['findings']:
+                st.warning(f"Found {result['total_findings']} potential secrets in this repository")
+                # Show first 5 in one block rather than a widget each
+                st.code(
+                    "\n".join(
+                        f"{finding.file_path}:{finding.line_number} - {finding.rule_id}"
+                        for finding in result['findings'][:5]
+                    ),
+                    language="text"
+                )
+                if len(result['findings']) > 5:
+                    st.caption(f"... and {len(result['findings']) - 5} more findings")
+            else:
+                st.success("No secrets detected")
+        total_secrets += result['total_findings']
+    
+    st.divider()
+    st.metric("Total Secrets Found Across All Repos", total_secrets)
+
+
+@st.fragment
+def render_results_tab(show_entropy: bool):
+    """Render the results of the latest scan."""
+    st.header("Scan Results")
+    
+    if st.session_state.scan_results is not None:
+        findings = st.session_state.scan_results
         
-        col1, col2, col3 = st.columns(3)
+        # Summary
+        render_findings_summary(findings)
         
+        if findings:
+            st.divider()
+            
+            # Charts
+            st.subheader("Visualization")
+            render_findings_charts(findings)
+            
+            st.divider()
+            
+            # Detailed table
+            render_findings_table(findings, show_entropy)
+    else:
+        st.info("No scan results yet. Go to the 'Scan Local' or 'Scan GitHub' tab to start scanning.")
+
+
+@st.fragment
+def render_about_tab():
+    """Render the about tab."""
+    st.header("About Secret Scanner")
+    
+    st.markdown("""
+    ### Features
+    - **30+ Detection Rules** - AWS, GitHub, Stripe, API keys, and more
+    - **Shannon Entropy Analysis** - Detect high-randomness secrets
+    - **Git History Scanning** - Find secrets in commit history
+    - **GitHub Integration** - Scan public repositories directly
+    - **Interactive UI** - Easy-to-use web interface
+    - **Visualizations** - Charts and graphs for analysis
+    - **Export Options** - JSON, CSV, Markdown reports
+    
+    ### Detection Categories
+    - Cloud Credentials (AWS, Google Cloud, Azure)
+    - Version Control Tokens (GitHub, GitLab)
+    - API Keys (Stripe, Slack, SendGrid, Twilio)
+    - Database Connection Strings
+    - Private Keys (RSA, EC, OpenSSH)
+    - JWT Tokens
+    - Generic High-Entropy Strings
+    
+    ### How It Works
+    1. **Pattern Matching**: Regex-based detection for known secret formats
+    2. **Entropy Analysis**: Shannon entropy calculation to find random-looking strings
+    3. **Smart Filtering**: Keyword optimization and path exclusions
+    4. **Reporting**: Detailed findings with line numbers and file paths
+    
+    ### Usage Tips
+    - Use **Git History** mode to find secrets introduced in past commits
+    - Enable **Show Entropy Values** to see randomness scores
+    - Filter results by **Rule Type** or **File** for focused analysis
+    - Export results for documentation or compliance reporting
+    
+    ### Version
+    - **Version**: 0.1.0
+    - **License**: MIT
+    - **Python**: 3.10+
+    
+    ### Resources
+    - [Documentation](README.md)
+    - [GitHub Repository](#)
+    - [Report Issues](#)
+    """)
+    
+    st.divider()
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("Detection Rules", len(st.session_state.config.rules) if st.session_state.config else "N/A")
+    
+    with col2:
+        st.metric("Exclusions", len(st.session_state.config.exclusions) if st.session_state.config else "N/A")
+    
+    with col3:
+        st.metric("Status", "Ready")
+
+
+@st.cache_resource(show_spinner=False)
+def logo_bytes() -> Optional[bytes]:
+    """Read the header logo once per process, or None if it is not installed."""
+    logo_path = Path(__file__).parent.parent.parent / "media" / "gitfih.png"
+    return logo_path.read_bytes() if logo_path.exists() else None
+
+
+def main():
+    """Main UI function."""
+    init_session_state()
+    
+    # Header with logo
+    logo = logo_bytes()
+    if logo:
+        col1, col2 = st.columns([1, 4])
         with col1:
-            st.metric("Detection Rules", len(st.session_state.config.rules) if st.session_state.config else "N/A")
-        
+            st.image(logo, width=150)
         with col2:
-            st.metric("Exclusions", len(st.session_state.config.exclusions) if st.session_state.config else "N/A")
-        
-        with col3:
-            st.metric("Status", "Ready")
+            st.title("Secret Scanner")
+            st.markdown("**Production-grade secret detection for Git repositories and files**")
+    else:
+        st.title("Secret Scanner")
+        st.markdown("**Production-grade secret detection for Git repositories and files**")
+    
+    # Sidebar
+    scan_mode, max_commits, show_entropy = render_sidebar()
+    tab1, tab2, tab3, tab4 = st.tabs(["Scan Local", "Scan GitHub", "Results", "About"])
+    
+    # Widgets inside a fragment tab rerun only that tab. The GitHub tab is not
+    # a fragment: its multi-repository scans fill the Results tab in the same run
+    with tab1:
+        render_local_tab(scan_mode, max_commits)
+    
+    with tab2:
+        render_github_tab(max_commits)
+    
+    with tab3:
+        render_results_tab(show_entropy)
+    
+    with tab4:
+        render_about_tab()
 
 
 if __name__ == "__main__":
@@ -19,12 +19,12 @@ echo "📝 Lines of Code:"
 echo "-----------------"
 echo "Source code:      $(find ./src -name "*.py" -exec wc -l {} + 2>/dev/null | tail -1 | awk '{print $1}' || echo 'N/A')"
 echo "Tests:            $(find ./tests -name "*.py" -exec wc -l {} + 2>/dev/null | tail -1 | awk '{print $1}' || echo 'N/A')"
-echo "Config rules:     $(wc -l < config/default_rules.yaml 2>/dev/null || echo 'N/A')"
+echo "Config rules:     $(wc -l < src/secret_scanner/data/default_rules.yaml 2>/dev/null || echo 'N/A')"
 echo ""
 
 echo "🎯 Features:"
 echo "------------"
-echo "Detection rules:  $(grep -c '^  - id:' config/default_rules.yaml 2>/dev/null || echo 'N/A')"
+echo "Detection rules:  $(grep -c '^  - id:' src/secret_scanner/data/default_rules.yaml 2>/dev/null || echo 'N/A')"
 echo "CLI commands:     4 (scan, validate, list-rules, generate-hook)"
 echo "Output formats:   4 (console, json, sarif, summary)"
 echo "Test modules:     3 (entropy, config, scanner)"
@@ -3,6 +3,21 @@
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add src directory to path
 src_path = Path(__file__).parent.parent / "src"
 sys.path.insert(0, str(src_path))
+
+
+@pytest.fixture(scope="session")
+def aws_config():
+    """Config with a single AWS key rule, compiled once for the whole session."""
+    from secret_scanner.config import Config
+    
+    config = Config(
+        rules=[{"id": "aws-key", "description": "AWS", "regex": r"AKIA[0-9A-Z]{16}"}],
+        exclusions=[]
+    )
+    config.compile(prefilter=True)
+    return config
@@ -1,5 +1,6 @@
 """Unit tests for the configuration loader."""
 
+import pickle
 import pytest
 import tempfile
 from pathlib import Path
@@ -63,6 +64,56 @@ exclusions:
         finally:
             Path(temp_path).unlink()
 
+    def test_invalid_regex(self):
+        """Loading a rule with an invalid regex should raise at load time."""
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            f.write("""
+rules:
+  - id: broken-rule
+    regex: "([a-z"
+""")
+            temp_path = f.name
+
+        try:
+            with pytest.raises(ValueError, match="broken-rule"):
+                load_rules(temp_path)
+        finally:
+            Path(temp_path).unlink()
+
+    def test_patterns_compiled_once(self):
+        """Compiled patterns should be cached on the Config."""
+        config = Config(rules=[{"id": "test", "regex": "AKIA[0-9A-Z]{16}"}], exclusions=[])
+        assert config.patterns is config.patterns
+        rule, pattern = config.patterns[0]
+        assert rule["id"] == "test"
+        assert pattern.search("akiaiosfodnn7example")
+
+    def test_compile_builds_patterns_up_front(self):
+        """compile() should fill the pattern cache and reject bad regexes."""
+        config = Config(rules=[{"id": "test", "regex": "AKIA[0-9A-Z]{16}"}], exclusions=[])
+        config.compile()
+        assert config._patterns is not None
+        assert config.patterns is config._patterns
+        
+        with pytest.raises(ValueError, match="broken"):
+            Config(rules=[{"id": "broken", "regex": "([a-z"}], exclusions=[]).compile()
+    
+    def test_patterns_follow_rules(self):
+        """Replacing rules should recompile patterns on next use."""
+        config = Config(rules=[{"id": "old", "regex": "old"}], exclusions=[])
+        assert config.patterns[0][0]["id"] == "old"
+        config.rules = [{"id": "new", "regex": "new"}]
+        assert config.patterns[0][0]["id"] == "new"
+
+    def test_pickle_round_trip(self):
+        """Configs should pickle without their compiled patterns."""
+        config = Config(rules=[{"id": "test", "regex": "AKIA[0-9A-Z]{16}"}], exclusions=["x/"])
+        config.compile()
+        restored = pickle.loads(pickle.dumps(config))
+        assert restored.rules == config.rules
+        assert restored.exclusions == ["x/"]
+        assert restored.patterns[0][1].pattern == "AKIA[0-9A-Z]{16}"
+
 
 class TestValidateConfig:
     """Tests for configuration validation."""
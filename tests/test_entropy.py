@@ -1,11 +1,16 @@
 """Unit tests for the entropy detector module."""
 
 import pytest
+from collections import Counter
+from secret_scanner.detectors import entropy
 from secret_scanner.detectors.entropy import (
+    NUMPY_MIN_LENGTH,
+    _entropy_from_counts,
     shannon_entropy,
     is_base64,
     is_hex,
-    calculate_entropy_score
+    calculate_entropy_score,
+    rolling_entropy
 )
 
 
@@ -35,6 +40,46 @@ class TestShannonEntropy:
         result = shannon_entropy("YWJjZGVmZ2hpamtsbW5vcHFyc3R1dnd4eXo=")
         assert result > 3.0
 
+    def test_long_string(self):
+        """Strings longer than the lookup table should use the same formula."""
+        result = shannon_entropy("ab" * 5000)
+        assert abs(result - 1.0) < 0.01
+    
+    def test_long_ascii_matches_counter(self):
+        """The numpy histogram path should agree with the Counter path."""
+        data = "K7gH9mP2qL5xN8wR/+=" * 20
+        expected = _entropy_from_counts(Counter(data).values(), len(data))
+        assert len(data) >= NUMPY_MIN_LENGTH
+        assert abs(shannon_entropy.__wrapped__(data) - expected) < 1e-9
+    
+    def test_long_ascii_without_numpy(self, monkeypatch):
+        """Long strings should fall back to Counter when numpy is missing."""
+        monkeypatch.setattr(entropy, "_numpy", lambda: None)
+        data = "K7gH9mP2qL5xN8wR/+=" * 20
+        expected = _entropy_from_counts(Counter(data).values(), len(data))
+        assert abs(shannon_entropy.__wrapped__(data) - expected) < 1e-9
+
+
+class TestRollingEntropy:
+    """Tests for sliding-window entropy."""
+    
+    def test_matches_per_window_entropy(self):
+        """Each value should equal the entropy of its window."""
+        data = "aaaaK7gH9mP2qL5xN8wRbbbbAKIAIOSFODNN7EXAMPLE"
+        result = rolling_entropy(data, 8)
+        assert len(result) == len(data) - 7
+        for i, value in enumerate(result):
+            assert abs(value - shannon_entropy(data[i:i + 8])) < 1e-9
+    
+    def test_short_input(self):
+        """Input shorter than the window should yield no values."""
+        assert rolling_entropy("abc", 5) == []
+    
+    def test_invalid_window(self):
+        """Non-positive windows should be rejected."""
+        with pytest.raises(ValueError):
+            rolling_entropy("abc", 0)
+
 
 class TestIsBase64:
     """Tests for base64 detection."""
@@ -78,6 +123,12 @@ class TestIsHex:
         """Uppercase hex should be detected."""
         assert is_hex("DEADBEEF1234567890ABCDEF")
 
+    def test_int_literal_syntax(self):
+        """Prefixes, separators and whitespace accepted by int() are not hex."""
+        assert not is_hex("0xdeadbeef12345678")
+        assert not is_hex("dead_beef_1234_5678")
+        assert not is_hex(" deadbeef12345678 ")
+
 
 class TestCalculateEntropyScore:
     """Tests for comprehensive entropy scoring."""
@@ -0,0 +1,94 @@
+"""Unit tests for the GitHub scanner helpers."""
+
+import base64
+import pytest
+from unittest.mock import MagicMock
+from github import GithubException
+from secret_scanner.github_scanner import GitHubScanner
+
+
+class TestParseRepoUrl:
+    """Tests for repository URL parsing."""
+    
+    @pytest.mark.parametrize("url", [
+        "owner/repo",
+        "https://github.com/owner/repo",
+        "https://github.com/owner/repo.git",
+        "https://www.github.com/owner/repo/",
+        "github.com/owner/repo",
+        "git@github.com:owner/repo.git",
+        "https://github.com/owner/repo/tree/main/src",
+    ])
+    def test_valid_urls(self, url):
+        """Common URL forms should parse to owner/repo."""
+        assert GitHubScanner._parse_repo_url(url) == "owner/repo"
+    
+    def test_dotted_repo_name(self):
+        """Dots inside repository names should be kept."""
+        assert GitHubScanner._parse_repo_url("https://github.com/socketio/socket.io.git") == "socketio/socket.io"
+    
+    @pytest.mark.parametrize("url", [
+        "https://gitlab.com/owner",
+        "gitlab.com/owner/repo",
+        "gitlab.com/owner",
+        "owner/repo/extra",
+    ])
+    def test_invalid_url(self, url):
+        """Other hosts and strings without owner and repo should be rejected."""
+        with pytest.raises(ValueError):
+            GitHubScanner._parse_repo_url(url)
+
+
+class TestGetRateLimit:
+    """Tests for rate-limit status caching."""
+    
+    def test_result_reused_within_ttl(self):
+        """Repeated calls should not hit the API again until the TTL expires."""
+        scanner = GitHubScanner.__new__(GitHubScanner)
+        scanner.github = MagicMock()
+        scanner.github.get_rate_limit.return_value.resources.core.remaining = 4999
+        scanner._rate_limit_cache = None
+        
+        first = scanner.get_rate_limit()
+        second = scanner.get_rate_limit()
+        assert second is first
+        assert first["core"]["remaining"] == 4999
+        assert scanner.github.get_rate_limit.call_count == 1
+
+
+class TestScanTarball:
+    """Tests for choosing between the archive and a clone."""
+    
+    @staticmethod
+    def make_scanner(attributes=None):
+        scanner = GitHubScanner.__new__(GitHubScanner)
+        scanner.session = MagicMock()
+        scanner._scan_checkout = MagicMock(return_value=["cloned"])
+        
+        repo = MagicMock(full_name="owner/repo", default_branch="main")
+        tree = repo.get_git_tree.return_value
+        tree.raw_data = {"truncated": False}
+        tree.tree = []
+        if attributes is not None:
+            tree.tree = [MagicMock(path="sub/.gitattributes", sha="abc")]
+            repo.get_git_blob.return_value.content = base64.b64encode(attributes).decode()
+        return scanner, repo
+    
+    def test_export_attributes_use_clone(self):
+        """export-ignore could hide files from the archive, so clone instead."""
+        scanner, repo = self.make_scanner(b"secrets.env export-ignore\n")
+        assert scanner._scan_tarball(repo) == ["cloned"]
+        scanner.session.get.assert_not_called()
+    
+    def test_failed_download_uses_clone(self):
+        """Archive errors should fall back to cloning."""
+        scanner, repo = self.make_scanner(b"* text=auto\n")
+        scanner.session.get.return_value.__enter__.return_value.ok = False
+        assert scanner._scan_tarball(repo) == ["cloned"]
+    
+    def test_empty_repository(self):
+        """Empty repositories have nothing to scan."""
+        scanner, repo = self.make_scanner()
+        repo.get_git_tree.side_effect = GithubException(409, {"message": "Git Repository is empty."}, None)
+        assert scanner._scan_tarball(repo) == []
+        scanner._scan_checkout.assert_not_called()